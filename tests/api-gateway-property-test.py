@@ -4,105 +4,135 @@ Property test for API Gateway endpoint creation
 Verifies that the deployed Lambda services have properly configured API Gateway endpoints
 """
 
+import asyncio
 import boto3
-import json
+import functools
+import itertools
 import sys
-from typing import Dict, List, Any
+from botocore.config import Config
+from typing import Dict, List, Any, Optional, Tuple
 
+# Client config for the concurrently running property tests
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 6},
+    tcp_keepalive=True
+)
+
+# Expected resource paths from our deployments
+EXPECTED_RESOURCE_PATHS = ('/chat', '/state', '/files', '/assistant', '/db')
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Get the shared boto3 session for the amplify profile"""
+    return boto3.Session(profile_name='amplify')
+
+@functools.lru_cache(maxsize=1)
 def get_api_gateway_client():
     """Get API Gateway client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('apigateway')
+    return _get_session().client('apigateway', config=CLIENT_CONFIG)
 
+@functools.lru_cache(maxsize=1)
 def get_lambda_client():
     """Get Lambda client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('lambda')
+    return _get_session().client('lambda', config=CLIENT_CONFIG)
 
-def test_api_gateway_exists():
-    """Test that API Gateway exists and is properly configured"""
-    client = get_api_gateway_client()
+@functools.cache
+def _find_amplify_api(name_substr: str) -> Optional[Dict[str, Any]]:
+    """Find the first Amplify REST API whose name contains name_substr (cached per run)"""
+    # Pages are fetched lazily, so pagination stops at the page holding the first match
+    paginator = get_api_gateway_client().get_paginator('get_rest_apis')
+    apis = itertools.chain.from_iterable(
+        page.get('items', []) for page in paginator.paginate(PaginationConfig={'PageSize': 500})
+    )
+    
+    return next((api for api in apis if name_substr in api.get('name', '')), None)
+
+@functools.lru_cache(maxsize=1)
+def _list_amplify_functions() -> Tuple[Dict[str, Any], ...]:
+    """List Lambda functions from the amplify-dev-lambda and amplify-dev-assistants services (cached per run)"""
+    paginator = get_lambda_client().get_paginator('list_functions')
     
+    return tuple(
+        func
+        for page in paginator.paginate()
+        for func in page.get('Functions', [])
+        if 'amplify-dev-lambda' in func.get('FunctionName', '')
+        or 'amplify-dev-assistants' in func.get('FunctionName', '')
+    )
+
+async def acall(fn, *args, **kwargs):
+    """Run a blocking boto3 call in a worker thread so tests can await it"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+async def _run_test(label: str, test_fn, *args):
+    """Run one property test with its own output list, returning (label, result, lines)"""
+    out = []
+    return label, await test_fn(*args, out=out), out
+
+async def test_api_gateway_exists(out: List[str]):
+    """Test that API Gateway exists and is properly configured"""
     try:
-        # Get all REST APIs
-        response = client.get_rest_apis()
-        apis = response.get('items', [])
-        
         # Find our API (should contain 'amplify-dev-lambda')
-        amplify_api = None
-        for api in apis:
-            if 'amplify-dev-lambda' in api.get('name', ''):
-                amplify_api = api
-                break
+        amplify_api = await acall(_find_amplify_api, 'amplify-dev-lambda')
         
         assert amplify_api is not None, "Amplify API Gateway not found"
         
         api_id = amplify_api['id']
-        print(f"✓ Found API Gateway: {amplify_api['name']} (ID: {api_id})")
+        out.append(f"✓ Found API Gateway: {amplify_api['name']} (ID: {api_id})")
         
         return api_id
         
     except Exception as e:
-        print(f"✗ API Gateway test failed: {str(e)}")
+        out.append(f"✗ API Gateway test failed: {str(e)}")
         return None
 
-def test_api_gateway_resources(api_id: str):
+async def test_api_gateway_resources(api_id: str, out: List[str]):
     """Test that API Gateway has the expected resources"""
     client = get_api_gateway_client()
     
     try:
         # Get all resources for the API
-        response = client.get_resources(restApiId=api_id)
+        response = await acall(client.get_resources, restApiId=api_id)
         resources = response.get('items', [])
         
-        # Expected resource paths from our deployments
-        expected_paths = [
-            '/chat',
-            '/state',
-            '/files',
-            '/assistant',
-            '/db'
-        ]
+        # Classify every resource against the expected paths in a single sweep,
+        # skipping paths that have already been matched
+        matched = {expected_path: False for expected_path in EXPECTED_RESOURCE_PATHS}
+        found_count = 0
         
-        found_paths = []
         for resource in resources:
             path = resource.get('path', '')
-            if path != '/':
-                found_paths.append(path)
+            if path == '/':
+                continue
+            
+            found_count += 1
+            for expected_path in EXPECTED_RESOURCE_PATHS:
+                if not matched[expected_path] and expected_path in path:
+                    matched[expected_path] = True
         
-        print(f"✓ Found {len(found_paths)} API Gateway resources")
+        out.append(f"✓ Found {found_count} API Gateway resources")
         
         # Check if we have the main expected paths
-        for expected_path in expected_paths:
-            matching_paths = [p for p in found_paths if expected_path in p]
-            if matching_paths:
-                print(f"✓ Found resources for path: {expected_path}")
+        for expected_path, found in matched.items():
+            if found:
+                out.append(f"✓ Found resources for path: {expected_path}")
             else:
-                print(f"⚠ No resources found for expected path: {expected_path}")
+                out.append(f"⚠ No resources found for expected path: {expected_path}")
         
-        return len(found_paths) > 0
+        return found_count > 0
         
     except Exception as e:
-        print(f"✗ API Gateway resources test failed: {str(e)}")
+        out.append(f"✗ API Gateway resources test failed: {str(e)}")
         return False
 
-def test_lambda_functions_exist():
+async def test_lambda_functions_exist(out: List[str]):
     """Test that Lambda functions are deployed and configured"""
-    client = get_lambda_client()
-    
     try:
-        # Get all Lambda functions
-        response = client.list_functions()
-        functions = response.get('Functions', [])
-        
-        # Find functions from our deployments
-        amplify_functions = []
-        for func in functions:
-            func_name = func.get('FunctionName', '')
-            if 'amplify-dev-lambda' in func_name or 'amplify-dev-assistants' in func_name:
-                amplify_functions.append(func)
+        # Find functions from our deployments across all pages
+        amplify_functions = await acall(_list_amplify_functions)
         
-        print(f"✓ Found {len(amplify_functions)} Amplify Lambda functions")
+        out.append(f"✓ Found {len(amplify_functions)} Amplify Lambda functions")
         
         # Check some key functions
         expected_function_patterns = [
@@ -115,46 +145,59 @@ def test_lambda_functions_exist():
         for pattern in expected_function_patterns:
             matching_funcs = [f for f in amplify_functions if pattern in f.get('FunctionName', '')]
             if matching_funcs:
-                print(f"✓ Found function matching pattern: {pattern}")
+                out.append(f"✓ Found function matching pattern: {pattern}")
             else:
-                print(f"⚠ No function found matching pattern: {pattern}")
+                out.append(f"⚠ No function found matching pattern: {pattern}")
         
         return len(amplify_functions) > 0
         
     except Exception as e:
-        print(f"✗ Lambda functions test failed: {str(e)}")
+        out.append(f"✗ Lambda functions test failed: {str(e)}")
         return False
 
-def test_api_gateway_integration():
+async def test_api_gateway_integration(api_id: str, out: List[str]):
     """Test that API Gateway is properly integrated with Lambda functions"""
     client = get_api_gateway_client()
     
     # This is a more complex test that would check the actual integrations
     # For now, we'll do a basic check
     try:
-        response = client.get_rest_apis()
-        apis = response.get('items', [])
-        
-        amplify_api = None
-        for api in apis:
-            if 'amplify-dev-lambda' in api.get('name', ''):
-                amplify_api = api
-                break
-        
-        if amplify_api:
-            # Check if the API has a deployment
-            deployments = client.get_deployments(restApiId=amplify_api['id'])
-            deployment_count = len(deployments.get('items', []))
-            
-            print(f"✓ API Gateway has {deployment_count} deployments")
-            return deployment_count > 0
+        # Check if the API has a deployment
+        deployments = await acall(client.get_deployments, restApiId=api_id)
+        deployment_count = len(deployments.get('items', []))
         
-        return False
+        out.append(f"✓ API Gateway has {deployment_count} deployments")
+        return deployment_count > 0
         
     except Exception as e:
-        print(f"✗ API Gateway integration test failed: {str(e)}")
+        out.append(f"✗ API Gateway integration test failed: {str(e)}")
         return False
 
+async def _run_all():
+    """Run the property tests concurrently, returning their results in test order"""
+    # Create both clients on the loop thread so the test threads only reuse them
+    get_api_gateway_client()
+    get_lambda_client()
+    
+    # Test 1 finds the API id the API Gateway tests depend on; Test 3 is independent
+    exists_task = asyncio.create_task(_run_test("1. Testing API Gateway existence...", test_api_gateway_exists))
+    lambda_task = asyncio.create_task(_run_test("3. Testing Lambda functions...", test_lambda_functions_exist))
+    
+    exists_result = await exists_task
+    api_id = exists_result[1]
+    
+    if api_id:
+        # Tests 2 and 4 run together once the API id is known
+        resources_result, integration_result = await asyncio.gather(
+            _run_test("2. Testing API Gateway resources...", test_api_gateway_resources, api_id),
+            _run_test("4. Testing API Gateway integration...", test_api_gateway_integration, api_id)
+        )
+    else:
+        resources_result = ("2. Skipping resource test (no API found)", False, [])
+        integration_result = ("4. Skipping integration test (no API found)", False, [])
+    
+    return [exists_result, resources_result, await lambda_task, integration_result]
+
 def main():
     """Run all property tests"""
     print("Running API Gateway Property Tests...")
@@ -163,29 +206,11 @@ def main():
     tests_passed = 0
     total_tests = 4
     
-    # Test 1: API Gateway exists
-    print("\n1. Testing API Gateway existence...")
-    api_id = test_api_gateway_exists()
-    if api_id:
-        tests_passed += 1
-    
-    # Test 2: API Gateway resources
-    if api_id:
-        print("\n2. Testing API Gateway resources...")
-        if test_api_gateway_resources(api_id):
+    for label, passed, lines in asyncio.run(_run_all()):
+        # One write per test instead of one print per log line
+        sys.stdout.write('\n'.join([f"\n{label}", *lines]) + '\n')
+        if passed:
             tests_passed += 1
-    else:
-        print("\n2. Skipping resource test (no API found)")
-    
-    # Test 3: Lambda functions exist
-    print("\n3. Testing Lambda functions...")
-    if test_lambda_functions_exist():
-        tests_passed += 1
-    
-    # Test 4: API Gateway integration
-    print("\n4. Testing API Gateway integration...")
-    if test_api_gateway_integration():
-        tests_passed += 1
     
     # Summary
     print("\n" + "=" * 50)
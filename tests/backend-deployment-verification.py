@@ -7,274 +7,324 @@ This script performs comprehensive verification of the backend deployment
 including API Gateway endpoints, Lambda functions, CloudWatch Logs, and Bedrock integration.
 """
 
+import asyncio
 import boto3
-import json
+import functools
+import itertools
 import sys
-import requests
-from typing import Dict, List, Any
+from botocore.config import Config
+from typing import Dict, List, Any, Optional, Tuple
 import time
 
+# One config for all four clients; the pool covers the per-function and per-API fan-outs
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 6},
+    tcp_keepalive=True
+)
+
+# Environment variables that indicate a function is configured for Bedrock
+BEDROCK_VARS = frozenset({'OPENAI_API_KEY', 'BEDROCK_AGENT_ID', 'BEDROCK_AGENT_ALIAS', 'BEDROCK_REGION'})
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Get the shared boto3 session for the amplify profile"""
+    return boto3.Session(profile_name='amplify')
+
+@functools.lru_cache(maxsize=1)
 def get_aws_clients():
-    """Get AWS clients with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
+    """Get AWS clients with amplify profile (created once per run)"""
+    session = _get_session()
     return {
-        'lambda': session.client('lambda'),
-        'apigateway': session.client('apigateway'),
-        'logs': session.client('logs'),
-        'cloudformation': session.client('cloudformation')
+        'lambda': session.client('lambda', config=CLIENT_CONFIG),
+        'apigateway': session.client('apigateway', config=CLIENT_CONFIG),
+        'logs': session.client('logs', config=CLIENT_CONFIG),
+        'cloudformation': session.client('cloudformation', config=CLIENT_CONFIG)
     }
 
-def test_api_gateway_endpoints():
+def _iter_amplify_functions():
+    """Yield Amplify Lambda functions lazily, one page at a time"""
+    paginator = get_aws_clients()['lambda'].get_paginator('list_functions')
+    
+    for page in paginator.paginate():
+        for func in page.get('Functions', []):
+            if 'amplify-dev-' in func.get('FunctionName', ''):
+                yield func
+
+@functools.lru_cache(maxsize=1)
+def _list_amplify_apis() -> Tuple[Dict[str, Any], ...]:
+    """List Amplify REST APIs across all pages once per run"""
+    paginator = get_aws_clients()['apigateway'].get_paginator('get_rest_apis')
+    apis = itertools.chain.from_iterable(
+        page.get('items', []) for page in paginator.paginate(PaginationConfig={'PageSize': 500})
+    )
+    
+    return tuple(api for api in apis if 'amplify-dev-' in api.get('name', ''))
+
+@functools.lru_cache(maxsize=1)
+def _list_amplify_stacks() -> Tuple[Dict[str, Any], ...]:
+    """List healthy Amplify CloudFormation stacks once per run"""
+    paginator = get_aws_clients()['cloudformation'].get_paginator('list_stacks')
+    
+    return tuple(
+        s
+        for page in paginator.paginate(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE'])
+        for s in page.get('StackSummaries', [])
+        if 'amplify-dev-' in s.get('StackName', '')
+    )
+
+async def acall(fn, *args, **kwargs):
+    """Run a blocking boto3 call in a worker thread so tests can await it"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+async def _gather_calls(fn, items):
+    """Call fn on every item concurrently, returning (item, result, error) tuples in input order"""
+    results = await asyncio.gather(*[acall(fn, item) for item in items], return_exceptions=True)
+    return [
+        (item, None, result) if isinstance(result, Exception) else (item, result, None)
+        for item, result in zip(items, results)
+    ]
+
+async def collect_lambda_state(clients, sample_size: int = 10) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+    """Scan Amplify Lambda functions once and summarize a sample for the Lambda and Bedrock tests,
+    returning (lambda_state, error) so each test can report a failed scan in its own output"""
+    try:
+        sample_functions = await acall(lambda: list(itertools.islice(_iter_amplify_functions(), sample_size)))
+        
+        # ListFunctions never returns State/LastUpdateStatus, so describe every sampled function concurrently
+        results = await _gather_calls(
+            lambda f: clients['lambda'].get_function_configuration(FunctionName=f.get('FunctionName', '')),
+            sample_functions
+        )
+        
+    except Exception as e:
+        return [], e
+    
+    lambda_state = []
+    for func, config_response, error in results:
+        func_name = func.get('FunctionName', '')
+        config_response = config_response or {}
+        lambda_state.append({
+            'name': func_name,
+            'state': config_response.get('State', ''),
+            'last_update_status': config_response.get('LastUpdateStatus', ''),
+            'env_vars': config_response.get('Environment', {}).get('Variables', {}),
+            'error': error
+        })
+    
+    return lambda_state, None
+
+async def test_api_gateway_endpoints(out: List[str]):
     """Test that API Gateway endpoints are accessible"""
     clients = get_aws_clients()
     
     try:
-        # Get API Gateway REST APIs
-        response = clients['apigateway'].get_rest_apis()
-        apis = response.get('items', [])
-        
-        # Find Amplify APIs
-        amplify_apis = [api for api in apis if 'amplify-dev-' in api.get('name', '')]
+        # Find Amplify APIs across all pages of REST APIs
+        amplify_apis = await acall(_list_amplify_apis)
+        api_count = len(amplify_apis)
         
         if not amplify_apis:
-            print("✗ No Amplify API Gateway APIs found")
+            out.append("✗ No Amplify API Gateway APIs found")
             return False
         
-        print(f"✓ Found {len(amplify_apis)} Amplify API Gateway APIs")
+        out.append(f"✓ Found {api_count} Amplify API Gateway APIs")
+        
+        # Get resources for every API concurrently
+        results = await _gather_calls(
+            lambda api: clients['apigateway'].get_resources(restApiId=api.get('id')),
+            amplify_apis
+        )
         
-        # Test each API
         working_apis = 0
         
-        for api in amplify_apis:
-            api_id = api.get('id')
+        for api, resources_response, error in results:
             api_name = api.get('name')
             
-            try:
-                # Get resources for this API
-                resources_response = clients['apigateway'].get_resources(restApiId=api_id)
-                resources = resources_response.get('items', [])
-                
-                # Count resources with methods
-                resources_with_methods = 0
-                for resource in resources:
-                    resource_methods = resource.get('resourceMethods', {})
-                    if resource_methods and len(resource_methods) > 0:
-                        resources_with_methods += 1
-                
-                if resources_with_methods > 0:
-                    working_apis += 1
-                    print(f"  ✓ {api_name}: {resources_with_methods} resources with methods")
-                else:
-                    print(f"  ⚠ {api_name}: No resources with methods found")
-                    
-            except Exception as e:
-                print(f"  ✗ {api_name}: Error checking resources - {str(e)}")
+            if error:
+                out.append(f"  ✗ {api_name}: Error checking resources - {str(error)}")
+                continue
+            
+            resources = resources_response.get('items', [])
+            
+            # Count resources with methods
+            resources_with_methods = 0
+            for resource in resources:
+                resource_methods = resource.get('resourceMethods', {})
+                if resource_methods and len(resource_methods) > 0:
+                    resources_with_methods += 1
+            
+            if resources_with_methods > 0:
+                working_apis += 1
+                out.append(f"  ✓ {api_name}: {resources_with_methods} resources with methods")
+            else:
+                out.append(f"  ⚠ {api_name}: No resources with methods found")
         
-        success_rate = working_apis / len(amplify_apis)
-        print(f"API Gateway Success Rate: {success_rate:.1%} ({working_apis}/{len(amplify_apis)})")
+        success_rate = working_apis / api_count
+        out.append(f"API Gateway Success Rate: {success_rate:.1%} ({working_apis}/{api_count})")
         
         return success_rate >= 0.80
         
     except Exception as e:
-        print(f"✗ API Gateway test failed: {str(e)}")
+        out.append(f"✗ API Gateway test failed: {str(e)}")
         return False
 
-def test_lambda_functions_invocable():
+async def test_lambda_functions_invocable(lambda_state: List[Dict[str, Any]], state_error: Optional[Exception], out: List[str]):
     """Test that Lambda functions are invocable"""
-    clients = get_aws_clients()
+    if state_error:
+        out.append(f"✗ Could not collect Lambda function state: {str(state_error)}")
+        return False
     
-    try:
-        # Get all Lambda functions
-        response = clients['lambda'].list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
-        
-        # Filter to Amplify functions
-        amplify_functions = [f for f in functions if 'amplify-dev-' in f.get('FunctionName', '')]
-        
-        if not amplify_functions:
-            print("✗ No Amplify Lambda functions found")
-            return False
-        
-        print(f"✓ Found {len(amplify_functions)} Amplify Lambda functions")
-        
-        # Test a sample of functions (to avoid rate limits)
-        sample_size = min(5, len(amplify_functions))
-        sample_functions = amplify_functions[:sample_size]
-        
-        invocable_functions = 0
-        
-        for func in sample_functions:
-            func_name = func.get('FunctionName', '')
-            
-            try:
-                # Try to get function configuration (this tests basic accessibility)
-                config_response = clients['lambda'].get_function_configuration(FunctionName=func_name)
-                
-                # Check if function is in a good state
-                state = config_response.get('State', '')
-                last_update_status = config_response.get('LastUpdateStatus', '')
-                
-                if state == 'Active' and last_update_status == 'Successful':
-                    invocable_functions += 1
-                    print(f"  ✓ {func_name}: Active and ready")
-                else:
-                    print(f"  ⚠ {func_name}: State={state}, UpdateStatus={last_update_status}")
-                    
-            except Exception as e:
-                print(f"  ✗ {func_name}: Error checking function - {str(e)}")
+    if not lambda_state:
+        out.append("✗ No Amplify Lambda functions found")
+        return False
+    
+    out.append(f"✓ Found Amplify Lambda functions ({len(lambda_state)} sampled)")
+    
+    invocable_functions = 0
+    
+    for func in lambda_state:
+        func_name = func['name']
         
-        success_rate = invocable_functions / len(sample_functions)
-        print(f"Lambda Function Success Rate: {success_rate:.1%} ({invocable_functions}/{len(sample_functions)} sampled)")
+        if func['error']:
+            out.append(f"  ✗ {func_name}: Error checking function - {str(func['error'])}")
+            continue
         
-        return success_rate >= 0.80
+        # Check if function is in a good state
+        state = func['state']
+        last_update_status = func['last_update_status']
         
-    except Exception as e:
-        print(f"✗ Lambda functions test failed: {str(e)}")
-        return False
+        if state == 'Active' and last_update_status == 'Successful':
+            invocable_functions += 1
+            out.append(f"  ✓ {func_name}: Active and ready")
+        else:
+            out.append(f"  ⚠ {func_name}: State={state}, UpdateStatus={last_update_status}")
+    
+    success_rate = invocable_functions / len(lambda_state)
+    out.append(f"Lambda Function Success Rate: {success_rate:.1%} ({invocable_functions}/{len(lambda_state)} sampled)")
+    
+    return success_rate >= 0.80
 
-def test_cloudwatch_logs_working():
+async def test_cloudwatch_logs_working(out: List[str]):
     """Test that CloudWatch Logs are working"""
     clients = get_aws_clients()
     
     try:
-        # Get Lambda log groups
-        log_groups = []
+        # Stream Amplify Lambda log groups (filtered server-side by name prefix), with pages
+        # sized to the sample so pagination stops after a single small request
+        sample_size = 10
         paginator = clients['logs'].get_paginator('describe_log_groups')
+        amplify_log_groups = (
+            lg
+            for page in paginator.paginate(
+                logGroupNamePrefix='/aws/lambda/amplify-dev-',
+                PaginationConfig={'PageSize': sample_size}
+            )
+            for lg in page.get('logGroups', [])
+        )
         
-        for page in paginator.paginate():
-            for lg in page.get('logGroups', []):
-                log_group_name = lg.get('logGroupName', '')
-                if log_group_name.startswith('/aws/lambda/amplify-dev-'):
-                    log_groups.append(lg)
+        # Check a sample of log groups for recent activity
+        sample_groups = await acall(lambda: list(itertools.islice(amplify_log_groups, sample_size)))
         
-        if not log_groups:
-            print("✗ No Amplify Lambda log groups found")
+        if not sample_groups:
+            out.append("✗ No Amplify Lambda log groups found")
             return False
         
-        print(f"✓ Found {len(log_groups)} Amplify Lambda log groups")
-        
-        # Check a sample of log groups for recent activity
-        sample_size = min(10, len(log_groups))
-        sample_groups = log_groups[:sample_size]
+        out.append(f"✓ Found Amplify Lambda log groups ({len(sample_groups)} sampled)")
         
         groups_with_activity = 0
         
-        for lg in sample_groups:
+        # Check for log streams concurrently (indicates the function has been invoked)
+        results = await _gather_calls(
+            lambda lg: clients['logs'].describe_log_streams(
+                logGroupName=lg.get('logGroupName', ''),
+                limit=1,
+                orderBy='LastEventTime',
+                descending=True
+            ),
+            sample_groups
+        )
+        
+        for lg, streams_response, error in results:
             log_group_name = lg.get('logGroupName', '')
             
-            try:
-                # Check for log streams (indicates the function has been invoked)
-                streams_response = clients['logs'].describe_log_streams(
-                    logGroupName=log_group_name,
-                    limit=1,
-                    orderBy='LastEventTime',
-                    descending=True
-                )
+            if error:
+                out.append(f"  ⚠ {log_group_name}: Error checking logs - {str(error)}")
+                continue
+            
+            streams = streams_response.get('logStreams', [])
+            if streams:
+                # Check if there's recent activity (within last 24 hours)
+                latest_stream = streams[0]
+                last_event_time = latest_stream.get('lastEventTime', 0)
+                current_time = int(time.time() * 1000)  # Convert to milliseconds
                 
-                streams = streams_response.get('logStreams', [])
-                if streams:
-                    # Check if there's recent activity (within last 24 hours)
-                    latest_stream = streams[0]
-                    last_event_time = latest_stream.get('lastEventTime', 0)
-                    current_time = int(time.time() * 1000)  # Convert to milliseconds
-                    
-                    # If there's activity within 24 hours, consider it active
-                    if current_time - last_event_time < 24 * 60 * 60 * 1000:
-                        groups_with_activity += 1
-                        print(f"  ✓ {log_group_name}: Recent activity")
-                    else:
-                        print(f"  ⚠ {log_group_name}: No recent activity")
+                # If there's activity within 24 hours, consider it active
+                if current_time - last_event_time < 24 * 60 * 60 * 1000:
+                    groups_with_activity += 1
+                    out.append(f"  ✓ {log_group_name}: Recent activity")
                 else:
-                    print(f"  ⚠ {log_group_name}: No log streams")
-                    
-            except Exception as e:
-                print(f"  ⚠ {log_group_name}: Error checking logs - {str(e)}")
+                    out.append(f"  ⚠ {log_group_name}: No recent activity")
+            else:
+                out.append(f"  ⚠ {log_group_name}: No log streams")
         
         # For this test, we don't require recent activity since functions may not have been invoked
         # We just check that log groups exist and are accessible
-        print(f"Log groups with recent activity: {groups_with_activity}/{len(sample_groups)} sampled")
-        print("✓ CloudWatch Logs are properly configured (activity not required)")
+        out.append(f"Log groups with recent activity: {groups_with_activity}/{len(sample_groups)} sampled")
+        out.append("✓ CloudWatch Logs are properly configured (activity not required)")
         
         return True
         
     except Exception as e:
-        print(f"✗ CloudWatch Logs test failed: {str(e)}")
+        out.append(f"✗ CloudWatch Logs test failed: {str(e)}")
         return False
 
-def test_bedrock_integration():
+async def test_bedrock_integration(lambda_state: List[Dict[str, Any]], state_error: Optional[Exception], out: List[str]):
     """Test Bedrock integration configuration"""
-    clients = get_aws_clients()
+    if state_error:
+        out.append(f"✗ Could not collect Lambda function state: {str(state_error)}")
+        return False
     
-    try:
-        # Check if functions have Bedrock-related environment variables
-        response = clients['lambda'].list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
-        
-        # Filter to Amplify functions
-        amplify_functions = [f for f in functions if 'amplify-dev-' in f.get('FunctionName', '')]
-        
-        if not amplify_functions:
-            print("✗ No Amplify Lambda functions found for Bedrock test")
-            return False
+    if not lambda_state:
+        out.append("✗ No Amplify Lambda functions found for Bedrock test")
+        return False
+    
+    functions_with_bedrock = 0
+    
+    for func in lambda_state:
+        func_name = func['name']
         
-        # Check a sample of functions for Bedrock configuration
-        sample_size = min(10, len(amplify_functions))
-        sample_functions = amplify_functions[:sample_size]
+        if func['error']:
+            out.append(f"  ⚠ {func_name}: Error checking Bedrock config - {str(func['error'])}")
+            continue
         
-        functions_with_bedrock = 0
+        # Check for Bedrock-related environment variables
+        matched = BEDROCK_VARS.intersection(func['env_vars'])
         
-        for func in sample_functions:
-            func_name = func.get('FunctionName', '')
-            
-            try:
-                # Get function configuration
-                config_response = clients['lambda'].get_function_configuration(FunctionName=func_name)
-                env_vars = config_response.get('Environment', {}).get('Variables', {})
-                
-                # Check for Bedrock-related environment variables
-                bedrock_vars = ['OPENAI_API_KEY', 'BEDROCK_AGENT_ID', 'BEDROCK_AGENT_ALIAS', 'BEDROCK_REGION']
-                has_bedrock_vars = any(var in env_vars for var in bedrock_vars)
-                
-                if has_bedrock_vars:
-                    functions_with_bedrock += 1
-                    print(f"  ✓ {func_name}: Has Bedrock configuration")
-                else:
-                    print(f"  ⚠ {func_name}: No Bedrock configuration")
-                    
-            except Exception as e:
-                print(f"  ⚠ {func_name}: Error checking Bedrock config - {str(e)}")
-        
-        # Some functions should have Bedrock configuration
-        if functions_with_bedrock > 0:
-            print(f"✓ Bedrock integration configured in {functions_with_bedrock}/{len(sample_functions)} sampled functions")
-            return True
+        if matched:
+            functions_with_bedrock += 1
+            out.append(f"  ✓ {func_name}: Has Bedrock configuration {sorted(matched)}")
         else:
-            print("⚠ No Bedrock integration found in sampled functions")
-            return False
-        
-    except Exception as e:
-        print(f"✗ Bedrock integration test failed: {str(e)}")
+            out.append(f"  ⚠ {func_name}: No Bedrock configuration")
+    
+    # Some functions should have Bedrock configuration
+    if functions_with_bedrock > 0:
+        out.append(f"✓ Bedrock integration configured in {functions_with_bedrock}/{len(lambda_state)} sampled functions")
+        return True
+    else:
+        out.append("⚠ No Bedrock integration found in sampled functions")
         return False
 
-def test_cloudformation_stacks_healthy():
+async def test_cloudformation_stacks_healthy(out: List[str]):
     """Test that CloudFormation stacks are in healthy state"""
-    clients = get_aws_clients()
-    
     try:
-        # Get CloudFormation stacks
-        response = clients['cloudformation'].list_stacks(
-            StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE']
-        )
-        stacks = response.get('StackSummaries', [])
-        
-        # Filter to Amplify stacks
-        amplify_stacks = [s for s in stacks if 'amplify-dev-' in s.get('StackName', '')]
+        # Get Amplify CloudFormation stacks across all pages
+        amplify_stacks = await acall(_list_amplify_stacks)
         
         if not amplify_stacks:
-            print("✗ No Amplify CloudFormation stacks found")
+            out.append("✗ No Amplify CloudFormation stacks found")
             return False
         
-        print(f"✓ Found {len(amplify_stacks)} Amplify CloudFormation stacks")
+        out.append(f"✓ Found {len(amplify_stacks)} Amplify CloudFormation stacks")
         
         # Check stack status
         healthy_stacks = 0
@@ -285,19 +335,41 @@ def test_cloudformation_stacks_healthy():
             
             if stack_status in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
                 healthy_stacks += 1
-                print(f"  ✓ {stack_name}: {stack_status}")
+                out.append(f"  ✓ {stack_name}: {stack_status}")
             else:
-                print(f"  ⚠ {stack_name}: {stack_status}")
+                out.append(f"  ⚠ {stack_name}: {stack_status}")
         
         success_rate = healthy_stacks / len(amplify_stacks)
-        print(f"Healthy CloudFormation Stacks: {success_rate:.1%} ({healthy_stacks}/{len(amplify_stacks)})")
+        out.append(f"Healthy CloudFormation Stacks: {success_rate:.1%} ({healthy_stacks}/{len(amplify_stacks)})")
         
         return success_rate >= 0.90
         
     except Exception as e:
-        print(f"✗ CloudFormation stacks test failed: {str(e)}")
+        out.append(f"✗ CloudFormation stacks test failed: {str(e)}")
         return False
 
+async def _run_test(label: str, test_fn, *args):
+    """Run a verification test, returning its label, result and captured output"""
+    out = []
+    return label, await test_fn(*args, out=out), out
+
+async def _run_all():
+    """Run all verification tests concurrently, returning their results in test order"""
+    # One Lambda scan feeds both the invocable and the Bedrock tests
+    lambda_state_task = asyncio.create_task(collect_lambda_state(get_aws_clients()))
+    
+    async def run_lambda_test(label: str, test_fn):
+        return await _run_test(label, test_fn, *await lambda_state_task)
+    
+    # The tests hit disjoint AWS services, so their network latency overlaps
+    return await asyncio.gather(
+        _run_test("1. Testing API Gateway endpoints...", test_api_gateway_endpoints),
+        run_lambda_test("2. Testing Lambda functions are invocable...", test_lambda_functions_invocable),
+        _run_test("3. Testing CloudWatch Logs...", test_cloudwatch_logs_working),
+        run_lambda_test("4. Testing Bedrock integration...", test_bedrock_integration),
+        _run_test("5. Testing CloudFormation stacks health...", test_cloudformation_stacks_healthy)
+    )
+
 def main():
     """Run comprehensive backend deployment verification"""
     print("Backend Deployment Verification")
@@ -307,30 +379,11 @@ def main():
     tests_passed = 0
     total_tests = 5
     
-    # Test 1: API Gateway endpoints
-    print("\n1. Testing API Gateway endpoints...")
-    if test_api_gateway_endpoints():
-        tests_passed += 1
-    
-    # Test 2: Lambda functions invocable
-    print("\n2. Testing Lambda functions are invocable...")
-    if test_lambda_functions_invocable():
-        tests_passed += 1
-    
-    # Test 3: CloudWatch Logs working
-    print("\n3. Testing CloudWatch Logs...")
-    if test_cloudwatch_logs_working():
-        tests_passed += 1
-    
-    # Test 4: Bedrock integration
-    print("\n4. Testing Bedrock integration...")
-    if test_bedrock_integration():
-        tests_passed += 1
-    
-    # Test 5: CloudFormation stacks healthy
-    print("\n5. Testing CloudFormation stacks health...")
-    if test_cloudformation_stacks_healthy():
-        tests_passed += 1
+    for label, passed, lines in asyncio.run(_run_all()):
+        # One write per test instead of one print per log line
+        sys.stdout.write('\n'.join([f"\n{label}", *lines]) + '\n')
+        if passed:
+            tests_passed += 1
     
     # Summary
     print("\n" + "=" * 50)
@@ -11,224 +11,353 @@ and have the necessary environment variables and IAM permissions.
 import boto3
 import json
 import sys
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Set
 
+# Pool sized for the threaded function and IAM policy lookups
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+@lru_cache(maxsize=1)
+def _session():
+    """Get the shared boto3 session for the amplify profile (created once per run)"""
+    return boto3.Session(profile_name='amplify')
+
+@lru_cache(maxsize=1)
 def get_lambda_client():
     """Get Lambda client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('lambda')
+    return _session().client('lambda', config=CLIENT_CONFIG)
 
+@lru_cache(maxsize=1)
 def get_iam_client():
     """Get IAM client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('iam')
+    return _session().client('iam', config=CLIENT_CONFIG)
 
+@lru_cache(maxsize=1)
 def get_secrets_client():
     """Get Secrets Manager client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('secretsmanager')
+    return _session().client('secretsmanager', config=CLIENT_CONFIG)
+
+# Expected Bedrock-related environment variables
+BEDROCK_ENV_VARS = frozenset([
+    'BEDROCK_AGENT_ID',
+    'BEDROCK_AGENT_ALIAS',
+    'BEDROCK_REGION',
+    'OPENAI_API_KEY',  # Used for Bedrock credentials
+    'OPENAI_ENDPOINTS'  # Used for Bedrock configuration
+])
+
+# IAM actions that count as Bedrock-related permissions: any Bedrock or Secrets Manager
+# action, or any invoke action (lambda:InvokeFunction, bedrock:InvokeAgent, ...)
+BEDROCK_ACTION_PREFIXES = ('bedrock:', 'secretsmanager:')
+INVOKE_ACTION_MARKER = ':invoke'
+
+# Responses shared between tests within a single run
+_CACHE = {}
+
+# One lock per cache entry so the first test thread to need it populates it and the rest reuse it
+_CACHE_LOCKS = {
+    'funcs': threading.Lock(),
+    'secrets': threading.Lock()
+}
 
-def test_bedrock_environment_variables():
-    """Test that Lambda functions have Bedrock-related environment variables"""
+def list_amplify_functions():
+    """List Amplify Lambda functions across all pages, fetching them only once per run"""
+    with _CACHE_LOCKS['funcs']:
+        if 'funcs' not in _CACHE:
+            paginator = get_lambda_client().get_paginator('list_functions')
+            _CACHE['funcs'] = [
+                f
+                for page in paginator.paginate(PaginationConfig={'PageSize': 50})
+                for f in page.get('Functions', [])
+                if 'amplify-dev-' in f.get('FunctionName', '')
+            ]
+    return _CACHE['funcs']
+
+def list_all_secrets():
+    """List Secrets Manager secrets across all pages, fetching them only once per run"""
+    with _CACHE_LOCKS['secrets']:
+        if 'secrets' not in _CACHE:
+            paginator = get_secrets_client().get_paginator('list_secrets')
+            _CACHE['secrets'] = [
+                secret
+                for page in paginator.paginate()
+                for secret in page.get('SecretList', [])
+            ]
+    return _CACHE['secrets']
+
+def test_bedrock_environment_variables(out: List[str], exhaustive: bool = False):
+    """
+    Test that Lambda functions have Bedrock-related environment variables
+    
+    The property only needs one configured function, so unless exhaustive is set the
+    scan stops at the first match instead of checking every function.
+    """
     client = get_lambda_client()
     
     try:
-        response = client.list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
-        
-        # Filter to Amplify functions
-        amplify_functions = [f for f in functions if 'amplify-dev-' in f.get('FunctionName', '')]
+        # Get Amplify Lambda functions (listed once and shared between tests)
+        amplify_functions = list_amplify_functions()
         
         if not amplify_functions:
-            print("⚠ No Amplify functions found")
+            out.append("⚠ No Amplify functions found")
             return False
         
-        # Expected Bedrock-related environment variables
-        bedrock_env_vars = [
-            'BEDROCK_AGENT_ID',
-            'BEDROCK_AGENT_ALIAS', 
-            'BEDROCK_REGION',
-            'OPENAI_API_KEY',  # Used for Bedrock credentials
-            'OPENAI_ENDPOINTS'  # Used for Bedrock configuration
-        ]
-        
-        functions_with_bedrock_config = 0
-        
-        for func in amplify_functions:
+        def _check_func(func):
+            """Return (func_name, bedrock_vars_found, error) for a single function"""
             func_name = func.get('FunctionName', '')
             
             # Get function configuration to check environment variables
             try:
                 config_response = client.get_function_configuration(FunctionName=func_name)
-                env_vars = config_response.get('Environment', {}).get('Variables', {})
-                
-                # Check if function has any Bedrock-related environment variables
-                has_bedrock_vars = any(var in env_vars for var in bedrock_env_vars)
-                
-                if has_bedrock_vars:
-                    functions_with_bedrock_config += 1
-                    bedrock_vars_found = [var for var in bedrock_env_vars if var in env_vars]
-                    print(f"✓ {func_name}: Has Bedrock vars: {bedrock_vars_found}")
-                
             except Exception as e:
-                print(f"⚠ Could not check environment variables for {func_name}: {str(e)}")
+                return func_name, [], e
+            
+            env_vars = config_response.get('Environment', {}).get('Variables', {})
+            
+            # Check if function has any Bedrock-related environment variables
+            bedrock_vars_found = sorted(BEDROCK_ENV_VARS & env_vars.keys())
+            return func_name, bedrock_vars_found, None
+        
+        # The configuration lookups are independent and I/O-bound, so fan them out
+        # over a thread pool sharing the (thread-safe) Lambda client
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            if exhaustive:
+                results = list(executor.map(_check_func, amplify_functions))
+            else:
+                futures = [executor.submit(_check_func, func) for func in amplify_functions]
+                results = []
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    if results[-1][1]:
+                        # Found one; drop the lookups that have not started yet
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        
+        functions_with_bedrock_config = 0
+        
+        for func_name, bedrock_vars_found, error in results:
+            if error:
+                out.append(f"⚠ Could not check environment variables for {func_name}: {str(error)}")
+            elif bedrock_vars_found:
+                functions_with_bedrock_config += 1
+                out.append(f"✓ {func_name}: Has Bedrock vars: {bedrock_vars_found}")
         
-        success_rate = functions_with_bedrock_config / len(amplify_functions)
-        print(f"✓ Functions with Bedrock configuration: {functions_with_bedrock_config}/{len(amplify_functions)} ({success_rate:.1%})")
+        if exhaustive or not functions_with_bedrock_config:
+            success_rate = functions_with_bedrock_config / len(amplify_functions)
+            out.append(f"✓ Functions with Bedrock configuration: {functions_with_bedrock_config}/{len(amplify_functions)} ({success_rate:.1%})")
+        else:
+            out.append(f"✓ Bedrock configuration found after checking {len(results)}/{len(amplify_functions)} functions (use --verbose for a full scan)")
         
         # Property: At least some functions should have Bedrock configuration
         return functions_with_bedrock_config > 0
         
     except Exception as e:
-        print(f"✗ Bedrock environment variables test failed: {str(e)}")
+        out.append(f"✗ Bedrock environment variables test failed: {str(e)}")
         return False
 
-def test_bedrock_secrets_exist():
+def test_bedrock_secrets_exist(out: List[str]):
     """Test that Bedrock-related secrets exist in AWS Secrets Manager"""
-    client = get_secrets_client()
-    
     try:
-        response = client.list_secrets()
-        secrets = response.get('SecretList', [])
+        secrets = list_all_secrets()
         
         # Expected Bedrock-related secrets (these will be created by Terraform)
-        expected_secrets = [
+        expected_secrets = (
             'app_secrets',
             'app_envs', 
             'openai_api_key',
             'openai_endpoints'
-        ]
+        )
+        expected_lower = tuple(expected.lower() for expected in expected_secrets)
         
         found_secrets = []
         for secret in secrets:
             secret_name = secret.get('Name', '')
-            for expected in expected_secrets:
-                if expected in secret_name.lower():
-                    found_secrets.append(expected)
-                    print(f"✓ Found secret: {secret_name}")
-                    break
+            name_lower = secret_name.lower()
+            matched = next((expected for expected in expected_lower if expected in name_lower), None)
+            if matched:
+                found_secrets.append(matched)
+                out.append(f"✓ Found secret: {secret_name}")
         
         success_rate = len(found_secrets) / len(expected_secrets)
-        print(f"✓ Bedrock secrets found: {len(found_secrets)}/{len(expected_secrets)} ({success_rate:.1%})")
+        out.append(f"✓ Bedrock secrets found: {len(found_secrets)}/{len(expected_secrets)} ({success_rate:.1%})")
         
         # Property: This test is informational at this stage since secrets are created by Terraform
         # We'll pass if we find any secrets, or if no secrets exist yet (pre-Terraform)
         if len(found_secrets) > 0:
-            print("✓ Some Bedrock secrets found - good configuration")
+            out.append("✓ Some Bedrock secrets found - good configuration")
             return True
         else:
-            print("⚠ No Bedrock secrets found yet - this is expected before Terraform deployment")
+            out.append("⚠ No Bedrock secrets found yet - this is expected before Terraform deployment")
             return True  # Pass since this is expected at this stage
         
     except Exception as e:
-        print(f"✗ Bedrock secrets test failed: {str(e)}")
+        out.append(f"✗ Bedrock secrets test failed: {str(e)}")
         return False
 
-def test_bedrock_iam_permissions():
-    """Test that Lambda execution roles have Bedrock permissions"""
+def _list_role_policy_tasks(role_name: str):
+    """List a role's attached and inline policies as (role_name, kind, policy) tasks, returning (tasks, error)"""
     iam_client = get_iam_client()
-    lambda_client = get_lambda_client()
     
     try:
-        # Get Lambda functions
-        response = lambda_client.list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
+        # Get attached policies
+        policies_response = iam_client.list_attached_role_policies(RoleName=role_name)
+        attached_policies = policies_response.get('AttachedPolicies', [])
+        
+        # Get inline policies
+        inline_response = iam_client.list_role_policies(RoleName=role_name)
+        inline_policies = inline_response.get('PolicyNames', [])
+        
+    except Exception as e:
+        return [], e
+    
+    tasks = [(role_name, 'attached', policy.get('PolicyArn', '')) for policy in attached_policies]
+    tasks.extend((role_name, 'inline', policy_name) for policy_name in inline_policies)
+    return tasks, None
+
+@lru_cache(maxsize=None)
+def _fetch_policy_document(policy_arn: str) -> Dict[str, Any]:
+    """Fetch the default version document of a managed policy (cached, since many roles share policies)"""
+    iam_client = get_iam_client()
+    
+    policy_response = iam_client.get_policy(PolicyArn=policy_arn)
+    policy_version = policy_response['Policy']['DefaultVersionId']
+    
+    version_response = iam_client.get_policy_version(
+        PolicyArn=policy_arn,
+        VersionId=policy_version
+    )
+    
+    return version_response['PolicyVersion']['Document']
+
+def _policy_task_key(task):
+    """Key attached managed policies by ARN alone so a policy shared by many roles is checked once"""
+    role_name, kind, policy = task
+    return (None, kind, policy) if kind == 'attached' else task
+
+def _action_matches(actions) -> bool:
+    """Check whether a statement's Action (a string or list of strings) grants a Bedrock-related permission"""
+    if isinstance(actions, str):
+        actions = [actions]
+    
+    return any(
+        action.lower().startswith(BEDROCK_ACTION_PREFIXES) or INVOKE_ACTION_MARKER in action.lower()
+        for action in actions
+    )
+
+def _policy_has_bedrock(policy_document: Dict[str, Any]) -> bool:
+    """Check a parsed policy document's statements for Bedrock-related permissions"""
+    statements = policy_document.get('Statement', [])
+    if not isinstance(statements, list):
+        statements = [statements]
+    
+    return any(_action_matches(statement.get('Action', [])) for statement in statements)
+
+def _policy_task_has_bedrock(task) -> bool:
+    """Fetch one attached or inline policy document and check it for Bedrock-related permissions"""
+    role_name, kind, policy = task
+    
+    try:
+        if kind == 'attached':
+            policy_document = _fetch_policy_document(policy)
+        else:
+            policy_response = get_iam_client().get_role_policy(
+                RoleName=role_name,
+                PolicyName=policy
+            )
+            policy_document = policy_response['PolicyDocument']
         
-        # Filter to Amplify functions
-        amplify_functions = [f for f in functions if 'amplify-dev-' in f.get('FunctionName', '')]
+        return _policy_has_bedrock(policy_document)
+        
+    except Exception:
+        return False
+
+def test_bedrock_iam_permissions(out: List[str]):
+    """Test that Lambda execution roles have Bedrock permissions"""
+    try:
+        # Get Amplify Lambda functions (listed once and shared between tests)
+        amplify_functions = list_amplify_functions()
         
         if not amplify_functions:
-            print("⚠ No Amplify functions found")
+            out.append("⚠ No Amplify functions found")
             return False
         
         roles_with_bedrock_permissions = 0
-        checked_roles = set()
         
-        for func in amplify_functions:
-            role_arn = func.get('Role', '')
-            if not role_arn or role_arn in checked_roles:
-                continue
-                
-            checked_roles.add(role_arn)
-            role_name = role_arn.split('/')[-1]
+        # Many functions share an execution role, so check each distinct role once
+        role_names = sorted({f.get('Role', '').split('/')[-1] for f in amplify_functions if f.get('Role')})
+        
+        # Fan the read-only IAM lookups out over a small pool, sized to stay within IAM's TPS budget
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            # List each role's attached and inline policies
+            listings = dict(zip(role_names, executor.map(_list_role_policy_tasks, role_names)))
             
-            try:
-                # Get attached policies
-                policies_response = iam_client.list_attached_role_policies(RoleName=role_name)
-                attached_policies = policies_response.get('AttachedPolicies', [])
-                
-                # Get inline policies
-                inline_response = iam_client.list_role_policies(RoleName=role_name)
-                inline_policies = inline_response.get('PolicyNames', [])
-                
-                has_bedrock_permissions = False
-                
-                # Check attached policies for Bedrock permissions
-                for policy in attached_policies:
-                    policy_arn = policy.get('PolicyArn', '')
-                    try:
-                        policy_response = iam_client.get_policy(PolicyArn=policy_arn)
-                        policy_version = policy_response['Policy']['DefaultVersionId']
-                        
-                        version_response = iam_client.get_policy_version(
-                            PolicyArn=policy_arn,
-                            VersionId=policy_version
-                        )
-                        
-                        policy_document = version_response['PolicyVersion']['Document']
-                        policy_json = json.dumps(policy_document).lower()
-                        
-                        # Check for Bedrock-related permissions
-                        if any(bedrock_term in policy_json for bedrock_term in [
-                            'bedrock', 'secretsmanager', 'invoke'
-                        ]):
-                            has_bedrock_permissions = True
-                            break
-                            
-                    except Exception:
-                        continue
-                
-                # Check inline policies for Bedrock permissions
-                if not has_bedrock_permissions:
-                    for policy_name in inline_policies:
-                        try:
-                            policy_response = iam_client.get_role_policy(
-                                RoleName=role_name,
-                                PolicyName=policy_name
-                            )
-                            
-                            policy_document = policy_response['PolicyDocument']
-                            policy_json = json.dumps(policy_document).lower()
-                            
-                            if any(bedrock_term in policy_json for bedrock_term in [
-                                'bedrock', 'secretsmanager', 'invoke'
-                            ]):
-                                has_bedrock_permissions = True
-                                break
-                                
-                        except Exception:
-                            continue
-                
-                if has_bedrock_permissions:
-                    roles_with_bedrock_permissions += 1
-                    print(f"✓ Role {role_name} has Bedrock-related permissions")
-                else:
-                    print(f"⚠ Role {role_name} may lack Bedrock permissions")
-                    
-            except Exception as e:
-                print(f"⚠ Could not check permissions for role {role_name}: {str(e)}")
+            # Fetch and check every distinct policy document across all roles at once
+            tasks = [task for policy_tasks, error in listings.values() if not error for task in policy_tasks]
+            unique_tasks = list(dict.fromkeys(_policy_task_key(task) for task in tasks))
+            policy_results = dict(zip(unique_tasks, executor.map(_policy_task_has_bedrock, unique_tasks)))
         
-        success_rate = roles_with_bedrock_permissions / len(checked_roles) if checked_roles else 0
-        print(f"✓ Roles with Bedrock permissions: {roles_with_bedrock_permissions}/{len(checked_roles)} ({success_rate:.1%})")
+        roles_with_bedrock = {task[0] for task in tasks if policy_results[_policy_task_key(task)]}
+        
+        for role_name in role_names:
+            _, error = listings[role_name]
+            
+            if error:
+                out.append(f"⚠ Could not check permissions for role {role_name}: {str(error)}")
+            elif role_name in roles_with_bedrock:
+                roles_with_bedrock_permissions += 1
+                out.append(f"✓ Role {role_name} has Bedrock-related permissions")
+            else:
+                out.append(f"⚠ Role {role_name} may lack Bedrock permissions")
+        
+        success_rate = roles_with_bedrock_permissions / len(role_names) if role_names else 0
+        out.append(f"✓ Roles with Bedrock permissions: {roles_with_bedrock_permissions}/{len(role_names)} ({success_rate:.1%})")
         
         # Property: At least 50% of roles should have Bedrock-related permissions
         return success_rate >= 0.50
         
     except Exception as e:
-        print(f"✗ Bedrock IAM permissions test failed: {str(e)}")
+        out.append(f"✗ Bedrock IAM permissions test failed: {str(e)}")
         return False
 
-def test_bedrock_agent_configuration():
+def _get_secret_strings(client, secret_ids: List[str]) -> Dict[str, Any]:
+    """
+    Fetch the SecretString of each secret, returning {secret_id: (secret_string, error)}
+    
+    Uses a single batch_get_secret_value call, falling back to one get_secret_value
+    call per secret where the batch API is unavailable.
+    """
+    if not secret_ids:
+        return {}
+    
+    try:
+        response = client.batch_get_secret_value(SecretIdList=secret_ids)
+    except (ClientError, AttributeError):
+        results = {}
+        for secret_id in secret_ids:
+            try:
+                secret_response = client.get_secret_value(SecretId=secret_id)
+                results[secret_id] = (secret_response.get('SecretString', '{}'), None)
+            except Exception as e:
+                results[secret_id] = (None, e)
+        return results
+    
+    results = {secret_id: (None, Exception("Secret not returned")) for secret_id in secret_ids}
+    for secret in response.get('SecretValues', []):
+        results[secret.get('Name')] = (secret.get('SecretString', '{}'), None)
+    for error in response.get('Errors', []):
+        results[error.get('SecretId')] = (None, Exception(f"{error.get('ErrorCode')}: {error.get('Message')}"))
+    return results
+
+def test_bedrock_agent_configuration(out: List[str]):
     """Test that Bedrock Agent configuration is properly set"""
     client = get_secrets_client()
     
@@ -241,105 +370,112 @@ def test_bedrock_agent_configuration():
         }
         
         configuration_found = 0
-        secrets_checked = 0
         
         # Try to get secrets that might contain Bedrock configuration
         secret_names = ['app_envs', 'openai_endpoints', 'app_secrets']
         
+        # List secrets once and pick the first match for each expected name
+        try:
+            all_secrets = list_all_secrets()
+        except Exception as e:
+            out.append(f"⚠ Error listing secrets: {str(e)}")
+            all_secrets = []
+        
+        matching_secrets = []
         for secret_name in secret_names:
+            matching_secret = next(
+                (s.get('Name') for s in all_secrets if secret_name in s.get('Name', '').lower()),
+                None
+            )
+            if matching_secret and matching_secret not in matching_secrets:
+                matching_secrets.append(matching_secret)
+        
+        secrets_checked = len(matching_secrets)
+        
+        # Fetch all matching secret values in a single round-trip (this will work if we have permissions)
+        secret_values = _get_secret_strings(client, matching_secrets)
+        
+        for matching_secret in matching_secrets:
+            secret_string, error = secret_values[matching_secret]
+            
+            if error:
+                out.append(f"⚠ Could not access secret {matching_secret}: {str(error)}")
+                continue
+            
+            # Try to parse as JSON
             try:
-                # List all secrets and find ones that match our pattern
-                response = client.list_secrets()
-                secrets = response.get('SecretList', [])
-                
-                matching_secret = None
-                for secret in secrets:
-                    if secret_name in secret.get('Name', '').lower():
-                        matching_secret = secret.get('Name')
-                        break
+                secret_data = json.loads(secret_string)
                 
-                if matching_secret:
-                    secrets_checked += 1
-                    # Try to get the secret value (this will work if we have permissions)
-                    try:
-                        secret_response = client.get_secret_value(SecretId=matching_secret)
-                        secret_string = secret_response.get('SecretString', '{}')
-                        
-                        # Try to parse as JSON
-                        try:
-                            secret_data = json.loads(secret_string)
+                # Check for Bedrock configuration
+                for key, expected_value in expected_bedrock_values.items():
+                    if key in secret_data:
+                        actual_value = secret_data[key]
+                        if actual_value == expected_value:
+                            configuration_found += 1
+                            out.append(f"✓ Found correct {key} configuration in {matching_secret}")
+                        else:
+                            out.append(f"⚠ Found {key} in {matching_secret} but value doesn't match expected")
                             
-                            # Check for Bedrock configuration
-                            for key, expected_value in expected_bedrock_values.items():
-                                if key in secret_data:
-                                    actual_value = secret_data[key]
-                                    if actual_value == expected_value:
-                                        configuration_found += 1
-                                        print(f"✓ Found correct {key} configuration in {matching_secret}")
-                                    else:
-                                        print(f"⚠ Found {key} in {matching_secret} but value doesn't match expected")
-                                        
-                        except json.JSONDecodeError:
-                            # Secret might not be JSON, check if it contains expected values
-                            for key, expected_value in expected_bedrock_values.items():
-                                if expected_value in secret_string:
-                                    configuration_found += 1
-                                    print(f"✓ Found {key} value in {matching_secret}")
-                                    
-                    except Exception as e:
-                        print(f"⚠ Could not access secret {matching_secret}: {str(e)}")
-                        
-            except Exception as e:
-                print(f"⚠ Error checking secret {secret_name}: {str(e)}")
+            except json.JSONDecodeError:
+                # Secret might not be JSON, check if it contains expected values
+                for key, expected_value in expected_bedrock_values.items():
+                    if expected_value in secret_string:
+                        configuration_found += 1
+                        out.append(f"✓ Found {key} value in {matching_secret}")
         
         success_rate = configuration_found / len(expected_bedrock_values) if len(expected_bedrock_values) > 0 else 0
-        print(f"✓ Bedrock configuration values found: {configuration_found}/{len(expected_bedrock_values)} ({success_rate:.1%})")
+        out.append(f"✓ Bedrock configuration values found: {configuration_found}/{len(expected_bedrock_values)} ({success_rate:.1%})")
         
         # Property: This test is informational at this stage since configuration is stored in Terraform-managed secrets
         # We'll pass if we find any configuration, or if no secrets exist yet (pre-Terraform)
         if secrets_checked == 0:
-            print("⚠ No Bedrock configuration secrets found yet - this is expected before Terraform deployment")
+            out.append("⚠ No Bedrock configuration secrets found yet - this is expected before Terraform deployment")
             return True  # Pass since this is expected at this stage
         elif configuration_found > 0:
-            print("✓ Some Bedrock configuration found - good setup")
+            out.append("✓ Some Bedrock configuration found - good setup")
             return True
         else:
-            print("⚠ Secrets exist but no Bedrock configuration found - may need investigation")
+            out.append("⚠ Secrets exist but no Bedrock configuration found - may need investigation")
             return True  # Still pass at this stage, but flag for attention
         
     except Exception as e:
-        print(f"✗ Bedrock agent configuration test failed: {str(e)}")
+        out.append(f"✗ Bedrock agent configuration test failed: {str(e)}")
         return False
 
-def main():
+def _run_test(test_fn, **kwargs):
+    """Call test_fn with a fresh output list; returns (passed, lines)"""
+    out = []
+    return test_fn(out=out, **kwargs), out
+
+def main(verbose: bool = False):
     """Run all property tests for Bedrock configuration in Lambda"""
     print("Running Bedrock Configuration Property Tests...")
     print("**Feature: amplify-aws-deployment, Property 11: Bedrock Configuration in Lambda**")
     print("**Validates: Requirements 3.2**")
     print("=" * 80)
     
-    tests_passed = 0
-    total_tests = 4
+    tests = [
+        ("1. Testing Bedrock environment variables in Lambda functions...", test_bedrock_environment_variables, {'exhaustive': verbose}),
+        ("2. Testing Bedrock secrets in AWS Secrets Manager...", test_bedrock_secrets_exist, {}),
+        ("3. Testing Bedrock IAM permissions...", test_bedrock_iam_permissions, {}),
+        ("4. Testing Bedrock Agent configuration...", test_bedrock_agent_configuration, {})
+    ]
     
-    # Test 1: Bedrock environment variables
-    print("\n1. Testing Bedrock environment variables in Lambda functions...")
-    if test_bedrock_environment_variables():
-        tests_passed += 1
+    # Build the Lambda, IAM and Secrets Manager clients before any worker thread needs them
+    get_lambda_client()
+    get_iam_client()
+    get_secrets_client()
     
-    # Test 2: Bedrock secrets exist
-    print("\n2. Testing Bedrock secrets in AWS Secrets Manager...")
-    if test_bedrock_secrets_exist():
-        tests_passed += 1
+    # The tests are independent and dominated by AWS I/O, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        results = list(executor.map(lambda test: _run_test(test[1], **test[2]), tests))
     
-    # Test 3: Bedrock IAM permissions
-    print("\n3. Testing Bedrock IAM permissions...")
-    if test_bedrock_iam_permissions():
-        tests_passed += 1
+    # Report in test order with a single write for all tests
+    report = [line for (label, _, _), (_, lines) in zip(tests, results) for line in (f"\n{label}", *lines)]
+    sys.stdout.write('\n'.join(report) + '\n')
     
-    # Test 4: Bedrock agent configuration
-    print("\n4. Testing Bedrock Agent configuration...")
-    if test_bedrock_agent_configuration():
-        tests_passed += 1
+    tests_passed = sum(1 for passed, _ in results if passed)
+    total_tests = len(tests)
     
     # Summary
     print("\n" + "=" * 80)
@@ -354,4 +490,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(verbose='--verbose' in sys.argv[1:]))
\ No newline at end of file
@@ -10,19 +10,83 @@ there exists a corresponding CloudWatch Log Group with appropriate configuration
 
 import boto3
 import sys
-from typing import Dict, List, Any, Set
+import threading
+from botocore.config import Config
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
 
+# Logs and Lambda clients are shared by the property threads and log group lookups
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+@lru_cache(maxsize=1)
+def _session():
+    """Get the shared boto3 session for the amplify profile (created once per run)"""
+    return boto3.Session(profile_name='amplify')
+
+@lru_cache(maxsize=1)
 def get_logs_client():
     """Get CloudWatch Logs client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('logs')
+    return _session().client('logs', config=CLIENT_CONFIG)
 
+@lru_cache(maxsize=1)
 def get_lambda_client():
     """Get Lambda client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('lambda')
+    return _session().client('lambda', config=CLIENT_CONFIG)
+
+# Length of the AWS Lambda log group prefix, /aws/lambda/, ahead of the function name
+_PREFIX_LEN = len('/aws/lambda/')
+
+# Responses shared between property tests within a single run
+_CACHE = {}
+
+# One lock per cache entry so the first test thread to need it populates it and the rest reuse it
+_CACHE_LOCKS = {
+    'funcs': threading.Lock(),
+    'log_groups': threading.Lock()
+}
+
+def list_amplify_functions():
+    """List Amplify Lambda functions across all pages, fetching them only once per run"""
+    with _CACHE_LOCKS['funcs']:
+        if 'funcs' not in _CACHE:
+            paginator = get_lambda_client().get_paginator('list_functions')
+            _CACHE['funcs'] = [
+                f
+                for page in paginator.paginate(PaginationConfig={'PageSize': 50})
+                for f in page.get('Functions', [])
+                if 'amplify-dev-' in f.get('FunctionName', '')
+            ]
+    return _CACHE['funcs']
+
+def list_amplify_log_groups():
+    """List Amplify Lambda log groups across all pages, fetching them only once per run"""
+    with _CACHE_LOCKS['log_groups']:
+        if 'log_groups' not in _CACHE:
+            # Filter by prefix server-side so unrelated log groups are never fetched
+            paginator = get_logs_client().get_paginator('describe_log_groups')
+            _CACHE['log_groups'] = [
+                lg
+                for page in paginator.paginate(logGroupNamePrefix='/aws/lambda/amplify-dev-')
+                for lg in page.get('logGroups', [])
+            ]
+    return _CACHE['log_groups']
+
+def _describe_log_group(log_group_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Fetch one log group record by exact name, returning (log_group, error)"""
+    try:
+        response = get_logs_client().describe_log_groups(logGroupNamePrefix=log_group_name, limit=1)
+    except Exception as e:
+        return None, e
+    
+    return next((lg for lg in response.get('logGroups', []) if lg.get('logGroupName') == log_group_name), None), None
 
-def property_lambda_function_has_log_group():
+def property_lambda_function_has_log_group(out: List[str]):
     """
     Property: For any Lambda function, there exists a corresponding CloudWatch Log Group
     
@@ -31,188 +95,170 @@ def property_lambda_function_has_log_group():
     2. Log group naming follows AWS conventions
     3. Log groups have appropriate retention settings
     """
-    logs_client = get_logs_client()
-    lambda_client = get_lambda_client()
-    
     try:
-        # Get all Lambda functions
-        lambda_response = lambda_client.list_functions(MaxItems=1000)
-        functions = lambda_response.get('Functions', [])
-        
-        # Filter to Amplify functions (our test domain)
-        amplify_functions = [f for f in functions if 'amplify-dev-' in f.get('FunctionName', '')]
+        # Get Amplify Lambda functions (our test domain)
+        amplify_functions = list_amplify_functions()
         
         if not amplify_functions:
-            print("⚠ No Amplify functions found for property testing")
+            out.append("⚠ No Amplify functions found for property testing")
             return True  # Vacuously true if no functions exist
         
-        print(f"Testing property for {len(amplify_functions)} Lambda functions...")
+        out.append(f"Testing property for {len(amplify_functions)} Lambda functions...")
         
-        # Get all log groups
-        log_groups = []
-        paginator = logs_client.get_paginator('describe_log_groups')
+        # Get Amplify Lambda log groups (Amplify functions are named amplify-dev-*)
+        log_groups = list_amplify_log_groups()
         
-        for page in paginator.paginate():
-            log_groups.extend(page.get('logGroups', []))
+        # Index log groups by name so each function needs a single lookup
+        log_group_by_name = {lg.get('logGroupName', ''): lg for lg in log_groups}
         
-        # Create a mapping of log group names for fast lookup
-        log_group_names = {lg.get('logGroupName', '') for lg in log_groups}
+        # Functions with amplify-dev- mid-name fall outside the prefix listing, so look up
+        # their log groups individually
+        unmatched_log_groups = [
+            f"/aws/lambda/{func.get('FunctionName', '')}"
+            for func in amplify_functions
+            if f"/aws/lambda/{func.get('FunctionName', '')}" not in log_group_by_name
+        ]
+        lookup_errors = {}
+        if unmatched_log_groups:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                lookups = executor.map(_describe_log_group, unmatched_log_groups)
+                for name, (log_group, error) in zip(unmatched_log_groups, lookups):
+                    if log_group:
+                        log_group_by_name[name] = log_group
+                    elif error:
+                        lookup_errors[name] = error
         
         # Property verification
-        property_violations = []
+        violation_count = 0
+        first_violations = []
+        
+        def _record_violation(message):
+            """Count a violation, keeping only the first 10 for the report"""
+            nonlocal violation_count
+            violation_count += 1
+            if len(first_violations) < 10:
+                first_violations.append(message)
         
         for func in amplify_functions:
             func_name = func.get('FunctionName', '')
             expected_log_group = f"/aws/lambda/{func_name}"
             
-            # Property 1: Log group must exist
-            if expected_log_group not in log_group_names:
-                property_violations.append(f"Function {func_name} missing log group {expected_log_group}")
+            # A failed lookup is reported on its own rather than as a missing log group
+            if expected_log_group in lookup_errors:
+                out.append(f"⚠ Could not check log group for {func_name}: {str(lookup_errors[expected_log_group])}")
                 continue
             
-            # Property 2: Log group naming convention
-            if not expected_log_group.startswith('/aws/lambda/'):
-                property_violations.append(f"Function {func_name} has invalid log group naming: {expected_log_group}")
+            # Property 1: Log group must exist
+            if not (matching_log_group := log_group_by_name.get(expected_log_group)):
+                _record_violation(f"Function {func_name} missing log group {expected_log_group}")
+                continue
             
-            # Property 3: Check retention settings (find the actual log group)
-            matching_log_group = None
-            for lg in log_groups:
-                if lg.get('logGroupName') == expected_log_group:
-                    matching_log_group = lg
-                    break
+            # Property 2: Log group naming convention holds by construction, since the group was
+            # found (listed or probed) under its exact /aws/lambda/ name
             
-            if matching_log_group:
-                retention_days = matching_log_group.get('retentionInDays')
-                # Property: Log groups should have reasonable retention (not infinite)
-                # We allow both set retention and no retention (infinite) as valid
-                if retention_days is not None and retention_days < 1:
-                    property_violations.append(f"Function {func_name} has invalid retention: {retention_days} days")
+            # Property 3: Check retention settings on the matching log group
+            retention_days = matching_log_group.get('retentionInDays')
+            # Property: Log groups should have reasonable retention (not infinite)
+            # We allow both set retention and no retention (infinite) as valid
+            if retention_days is not None and retention_days < 1:
+                _record_violation(f"Function {func_name} has invalid retention: {retention_days} days")
         
         # Report results
-        if property_violations:
-            print(f"✗ Property violations found ({len(property_violations)}):")
-            for violation in property_violations[:10]:  # Show first 10 violations
-                print(f"  - {violation}")
-            if len(property_violations) > 10:
-                print(f"  ... and {len(property_violations) - 10} more violations")
+        if violation_count:
+            out.append(f"✗ Property violations found ({violation_count}):")
+            for violation in first_violations:  # Show first 10 violations
+                out.append(f"  - {violation}")
+            if violation_count > len(first_violations):
+                out.append(f"  ... and {violation_count - len(first_violations)} more violations")
             return False
         else:
-            print(f"✓ Property holds: All {len(amplify_functions)} functions have valid log groups")
+            checked_functions = len(amplify_functions) - len(lookup_errors)
+            out.append(f"✓ Property holds: All {checked_functions} checked functions have valid log groups")
             return True
             
     except Exception as e:
-        print(f"✗ Property test failed with exception: {str(e)}")
+        out.append(f"✗ Property test failed with exception: {str(e)}")
         return False
 
-def property_log_group_naming_consistency():
+def property_log_group_naming_consistency(out: List[str]):
     """
     Property: Log group names follow consistent AWS Lambda naming conventions
     
     This property verifies that all Lambda log groups follow the pattern:
     /aws/lambda/{function-name}
     """
-    logs_client = get_logs_client()
-    
     try:
         # Get all Lambda log groups
-        log_groups = []
-        paginator = logs_client.get_paginator('describe_log_groups')
-        
-        for page in paginator.paginate():
-            for lg in page.get('logGroups', []):
-                log_group_name = lg.get('logGroupName', '')
-                if log_group_name.startswith('/aws/lambda/amplify-dev-'):
-                    log_groups.append(lg)
+        log_groups = list_amplify_log_groups()
         
         if not log_groups:
-            print("⚠ No Amplify Lambda log groups found for property testing")
+            out.append("⚠ No Amplify Lambda log groups found for property testing")
             return True
         
-        print(f"Testing naming consistency property for {len(log_groups)} log groups...")
+        out.append(f"Testing naming consistency property for {len(log_groups)} log groups...")
+        
+        violation_count = 0
+        first_violations = []
         
-        naming_violations = []
+        def _record_violation(message):
+            """Count a violation, keeping only the first 5 for the report"""
+            nonlocal violation_count
+            violation_count += 1
+            if len(first_violations) < 5:
+                first_violations.append(message)
         
         for lg in log_groups:
-            log_group_name = lg.get('logGroupName', '')
-            
-            # Property: Must start with /aws/lambda/
-            if not log_group_name.startswith('/aws/lambda/'):
-                naming_violations.append(f"Invalid prefix: {log_group_name}")
-                continue
-            
-            # Extract function name
-            function_name = log_group_name[len('/aws/lambda/'):]
-            
-            # Property: Function name should follow Amplify naming convention
-            if not function_name.startswith('amplify-dev-'):
-                naming_violations.append(f"Invalid function naming: {function_name}")
-                continue
+            # The listing is filtered server-side to /aws/lambda/amplify-dev-, so the
+            # AWS and Amplify prefixes already hold; extract the function name
+            function_name = lg['logGroupName'][_PREFIX_LEN:]
             
             # Property: Function name should end with service and function parts
             if not function_name.endswith('-dev'):
                 # Check if it has the expected pattern: amplify-dev-{service}-dev-{function}
-                parts = function_name.split('-')
-                if len(parts) < 4 or parts[0] != 'amplify' or parts[1] != 'dev':
-                    naming_violations.append(f"Invalid naming pattern: {function_name}")
+                if len(function_name.split('-')) < 4:
+                    _record_violation(f"Invalid naming pattern: {function_name}")
         
         # Report results
-        if naming_violations:
-            print(f"✗ Naming consistency violations found ({len(naming_violations)}):")
-            for violation in naming_violations[:5]:  # Show first 5 violations
-                print(f"  - {violation}")
-            if len(naming_violations) > 5:
-                print(f"  ... and {len(naming_violations) - 5} more violations")
+        if violation_count:
+            out.append(f"✗ Naming consistency violations found ({violation_count}):")
+            for violation in first_violations:  # Show first 5 violations
+                out.append(f"  - {violation}")
+            if violation_count > len(first_violations):
+                out.append(f"  ... and {violation_count - len(first_violations)} more violations")
             return False
         else:
-            print(f"✓ Property holds: All {len(log_groups)} log groups follow naming conventions")
+            out.append(f"✓ Property holds: All {len(log_groups)} log groups follow naming conventions")
             return True
             
     except Exception as e:
-        print(f"✗ Property test failed with exception: {str(e)}")
+        out.append(f"✗ Property test failed with exception: {str(e)}")
         return False
 
-def property_log_retention_consistency():
+def property_log_retention_consistency(out: List[str]):
     """
     Property: Log groups with retention settings have consistent, reasonable values
     
     This property verifies that when retention is set, it follows organizational standards.
     """
-    logs_client = get_logs_client()
-    
     try:
         # Get all Amplify Lambda log groups
-        log_groups = []
-        paginator = logs_client.get_paginator('describe_log_groups')
-        
-        for page in paginator.paginate():
-            for lg in page.get('logGroups', []):
-                log_group_name = lg.get('logGroupName', '')
-                if log_group_name.startswith('/aws/lambda/amplify-dev-'):
-                    log_groups.append(lg)
+        log_groups = list_amplify_log_groups()
         
         if not log_groups:
-            print("⚠ No Amplify Lambda log groups found for property testing")
+            out.append("⚠ No Amplify Lambda log groups found for property testing")
             return True
         
-        print(f"Testing retention consistency property for {len(log_groups)} log groups...")
+        out.append(f"Testing retention consistency property for {len(log_groups)} log groups...")
         
         # Collect retention values
-        retention_values = {}
-        groups_with_retention = 0
-        
-        for lg in log_groups:
-            log_group_name = lg.get('logGroupName', '')
-            retention_days = lg.get('retentionInDays')
-            
-            if retention_days is not None:
-                groups_with_retention += 1
-                if retention_days not in retention_values:
-                    retention_values[retention_days] = 0
-                retention_values[retention_days] += 1
+        retention_values = Counter(
+            lg['retentionInDays'] for lg in log_groups if lg.get('retentionInDays') is not None
+        )
+        groups_with_retention = sum(retention_values.values())
         
-        print(f"Groups with retention: {groups_with_retention}/{len(log_groups)}")
+        out.append(f"Groups with retention: {groups_with_retention}/{len(log_groups)}")
         if retention_values:
-            print(f"Retention values found: {retention_values}")
+            out.append(f"Retention values found: {dict(retention_values)}")
         
         # Property checks
         retention_violations = []
@@ -225,8 +271,7 @@ def property_log_retention_consistency():
         # Property 2: Most groups should have consistent retention (if any retention is set)
         if retention_values and groups_with_retention > 0:
             # Find the most common retention value
-            most_common_retention = max(retention_values.items(), key=lambda x: x[1])
-            most_common_count = most_common_retention[1]
+            most_common_retention, most_common_count = retention_values.most_common(1)[0]
             
             # Property: At least 80% of groups with retention should use the same value
             consistency_rate = most_common_count / groups_with_retention
@@ -235,18 +280,23 @@ def property_log_retention_consistency():
         
         # Report results
         if retention_violations:
-            print(f"✗ Retention consistency violations found ({len(retention_violations)}):")
+            out.append(f"✗ Retention consistency violations found ({len(retention_violations)}):")
             for violation in retention_violations:
-                print(f"  - {violation}")
+                out.append(f"  - {violation}")
             return False
         else:
-            print(f"✓ Property holds: Retention settings are consistent and reasonable")
+            out.append(f"✓ Property holds: Retention settings are consistent and reasonable")
             return True
             
     except Exception as e:
-        print(f"✗ Property test failed with exception: {str(e)}")
+        out.append(f"✗ Property test failed with exception: {str(e)}")
         return False
 
+def _run_property(property_fn):
+    """Check one property, returning whether it held and the lines it logged"""
+    out = []
+    return property_fn(out=out), out
+
 def main():
     """Run all CloudWatch Log Groups property tests"""
     print("Running CloudWatch Log Groups Property Tests...")
@@ -254,23 +304,26 @@ def main():
     print("**Validates: Requirements 6.1**")
     print("=" * 80)
     
-    properties_passed = 0
-    total_properties = 3
+    properties = [
+        ("1. Testing Property: Lambda functions have corresponding log groups...", property_lambda_function_has_log_group),
+        ("2. Testing Property: Log group naming follows AWS conventions...", property_log_group_naming_consistency),
+        ("3. Testing Property: Log retention settings are consistent...", property_log_retention_consistency)
+    ]
+    
+    # Create both clients here rather than racing to build them from the property threads
+    get_lambda_client()
+    get_logs_client()
     
-    # Property 1: Lambda functions have log groups
-    print("\n1. Testing Property: Lambda functions have corresponding log groups...")
-    if property_lambda_function_has_log_group():
-        properties_passed += 1
+    # The properties are independent and dominated by AWS I/O, so check them concurrently
+    with ThreadPoolExecutor(max_workers=len(properties)) as executor:
+        results = list(executor.map(lambda prop: _run_property(prop[1]), properties))
     
-    # Property 2: Log group naming consistency
-    print("\n2. Testing Property: Log group naming follows AWS conventions...")
-    if property_log_group_naming_consistency():
-        properties_passed += 1
+    # Report in property order with a single write for all properties
+    report = [line for (label, _), (_, lines) in zip(properties, results) for line in (f"\n{label}", *lines)]
+    sys.stdout.write('\n'.join(report) + '\n')
     
-    # Property 3: Log retention consistency
-    print("\n3. Testing Property: Log retention settings are consistent...")
-    if property_log_retention_consistency():
-        properties_passed += 1
+    properties_passed = sum(1 for passed, _ in results if passed)
+    total_properties = len(properties)
     
     # Summary
     print("\n" + "=" * 80)
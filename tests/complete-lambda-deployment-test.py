@@ -9,132 +9,158 @@ and are properly configured with the required resources.
 """
 
 import boto3
-import json
+import re
 import sys
-from typing import Dict, List, Any, Set
+import threading
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Set, Tuple
+
+# Client config for the deployment phases running in parallel
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+# Expected Amplify services that should be deployed
+EXPECTED_SERVICES = (
+    'assistants',
+    'lambda',
+    'admin', 
+    'api',
+    'artifacts',
+    'amplify-js',
+    'lambda-ops',
+    'chat-billing',
+    'data-disclosure',
+    'embedding',
+    'object-access'
+)
+
+# Stack/function name prefix of each service, and a regex naming the service of a resource
+SERVICE_PREFIXES = tuple((service, f"amplify-dev-{service}-dev") for service in EXPECTED_SERVICES)
+SERVICE_REGEX = re.compile(r'amplify-dev-(' + '|'.join(map(re.escape, EXPECTED_SERVICES)) + r')-dev')
+
+@lru_cache(maxsize=1)
+def _session():
+    """Get the shared boto3 session for the amplify profile (created once per run)"""
+    return boto3.Session(profile_name='amplify')
+
+@lru_cache(maxsize=None)
+def _client(name: str):
+    """Get the shared client for an AWS service (one per service per run)"""
+    return _session().client(name, config=CLIENT_CONFIG)
 
 def get_lambda_client():
     """Get Lambda client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('lambda')
+    return _client('lambda')
 
 def get_cloudformation_client():
     """Get CloudFormation client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('cloudformation')
+    return _client('cloudformation')
 
-def get_expected_services() -> List[str]:
-    """Return list of expected Amplify services that should be deployed"""
-    return [
-        'assistants',
-        'lambda',
-        'admin', 
-        'api',
-        'artifacts',
-        'amplify-js',
-        'lambda-ops',
-        'chat-billing',
-        'data-disclosure',
-        'embedding',
-        'object-access'
-    ]
+# The function listing read by phases 2 and 3; whichever phase gets the lock first fetches it
+_CACHE = {}
+_CACHE_LOCKS = {
+    'funcs': threading.Lock()
+}
+
+def _amplify_functions() -> Tuple[Dict[str, Any], ...]:
+    """List Amplify Lambda functions across all pages (fetched once and shared between tests)"""
+    with _CACHE_LOCKS['funcs']:
+        if 'funcs' not in _CACHE:
+            # FunctionVersion is left unset so each function is listed once rather than once per
+            # version, and non-Amplify functions are dropped page by page instead of kept in memory
+            paginator = get_lambda_client().get_paginator('list_functions')
+            _CACHE['funcs'] = tuple(
+                f
+                for page in paginator.paginate()
+                for f in page.get('Functions', [])
+                if 'amplify-dev-' in f.get('FunctionName', '')
+            )
+    return _CACHE['funcs']
 
-def test_cloudformation_stacks_exist():
+def test_cloudformation_stacks_exist(out: List[str]):
     """Test that all expected CloudFormation stacks exist and are in CREATE_COMPLETE state"""
     client = get_cloudformation_client()
     
     try:
-        response = client.list_stacks(
-            StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE']
-        )
-        stacks = response.get('StackSummaries', [])
+        paginator = client.get_paginator('list_stacks')
+        pages = paginator.paginate(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE'])
+        stacks = pages.build_full_result().get('StackSummaries', [])
         
-        expected_services = get_expected_services()
         found_stacks = []
         
         for stack in stacks:
             stack_name = stack.get('StackName', '')
             # Check if this stack matches any of our expected services
-            for service in expected_services:
-                if f"amplify-dev-{service}-dev" in stack_name:
-                    found_stacks.append(service)
-                    print(f"✓ Found stack for service: {service}")
-                    break
+            service = next((service for service, prefix in SERVICE_PREFIXES if prefix in stack_name), None)
+            if service:
+                found_stacks.append(service)
+                out.append(f"✓ Found stack for service: {service}")
         
-        missing_services = set(expected_services) - set(found_stacks)
+        missing_services = set(EXPECTED_SERVICES) - set(found_stacks)
         if missing_services:
-            print(f"⚠ Missing stacks for services: {missing_services}")
+            out.append(f"⚠ Missing stacks for services: {missing_services}")
         
-        success_rate = len(found_stacks) / len(expected_services)
-        print(f"✓ Stack deployment success rate: {success_rate:.1%} ({len(found_stacks)}/{len(expected_services)})")
+        success_rate = len(found_stacks) / len(EXPECTED_SERVICES)
+        out.append(f"✓ Stack deployment success rate: {success_rate:.1%} ({len(found_stacks)}/{len(EXPECTED_SERVICES)})")
         
         # Property: At least 80% of expected services should be deployed
         return success_rate >= 0.8
         
     except Exception as e:
-        print(f"✗ CloudFormation stacks test failed: {str(e)}")
+        out.append(f"✗ CloudFormation stacks test failed: {str(e)}")
         return False
 
-def test_lambda_functions_deployed():
+def test_lambda_functions_deployed(out: List[str]):
     """Test that Lambda functions from all services are deployed"""
-    client = get_lambda_client()
-    
     try:
-        response = client.list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
+        functions = _amplify_functions()
         
         # Count functions by service
         service_function_counts = {}
-        expected_services = get_expected_services()
         
-        for service in expected_services:
+        for service in EXPECTED_SERVICES:
             service_function_counts[service] = 0
         
+        # Classify each function by service with a single regex match
         for func in functions:
-            func_name = func.get('FunctionName', '')
-            for service in expected_services:
-                if f"amplify-dev-{service}-dev" in func_name:
-                    service_function_counts[service] += 1
-                    break
+            match = SERVICE_REGEX.search(func.get('FunctionName', ''))
+            if match:
+                service_function_counts[match.group(1)] += 1
         
         total_functions = sum(service_function_counts.values())
         services_with_functions = len([s for s in service_function_counts.values() if s > 0])
         
-        print(f"✓ Total Lambda functions deployed: {total_functions}")
-        print(f"✓ Services with functions: {services_with_functions}/{len(expected_services)}")
+        out.append(f"✓ Total Lambda functions deployed: {total_functions}")
+        out.append(f"✓ Services with functions: {services_with_functions}/{len(EXPECTED_SERVICES)}")
         
         # Show function counts per service
         for service, count in service_function_counts.items():
             if count > 0:
-                print(f"  - {service}: {count} functions")
+                out.append(f"  - {service}: {count} functions")
             else:
-                print(f"  ⚠ {service}: 0 functions")
+                out.append(f"  ⚠ {service}: 0 functions")
         
         # Property: At least 75% of services should have functions deployed
-        success_rate = services_with_functions / len(expected_services)
+        success_rate = services_with_functions / len(EXPECTED_SERVICES)
         return success_rate >= 0.75
         
     except Exception as e:
-        print(f"✗ Lambda functions test failed: {str(e)}")
+        out.append(f"✗ Lambda functions test failed: {str(e)}")
         return False
 
-def test_lambda_function_configurations():
+def test_lambda_function_configurations(out: List[str]):
     """Test that Lambda functions have proper configurations"""
-    client = get_lambda_client()
-    
     try:
-        response = client.list_functions(MaxItems=1000)
-        functions = response.get('Functions', [])
-        
-        # Filter to our Amplify functions
-        amplify_functions = []
-        for func in functions:
-            func_name = func.get('FunctionName', '')
-            if 'amplify-dev-' in func_name and '-dev-' in func_name:
-                amplify_functions.append(func)
+        # Amplify functions, already filtered while paging through the listing
+        amplify_functions = _amplify_functions()
         
         if not amplify_functions:
-            print("⚠ No Amplify functions found")
+            out.append("⚠ No Amplify functions found")
             return False
         
         # Check configurations
@@ -164,25 +190,25 @@ def test_lambda_function_configurations():
             if config_ok:
                 properly_configured += 1
             else:
-                print(f"⚠ Configuration issue in {func_name}: runtime={runtime}, timeout={timeout}s, memory={memory}MB")
+                out.append(f"⚠ Configuration issue in {func_name}: runtime={runtime}, timeout={timeout}s, memory={memory}MB")
         
         success_rate = properly_configured / len(amplify_functions)
-        print(f"✓ Properly configured functions: {properly_configured}/{len(amplify_functions)} ({success_rate:.1%})")
+        out.append(f"✓ Properly configured functions: {properly_configured}/{len(amplify_functions)} ({success_rate:.1%})")
         
         # Property: At least 90% of functions should be properly configured
         return success_rate >= 0.90
         
     except Exception as e:
-        print(f"✗ Lambda configuration test failed: {str(e)}")
+        out.append(f"✗ Lambda configuration test failed: {str(e)}")
         return False
 
-def test_lambda_layers_deployed():
+def test_lambda_layers_deployed(out: List[str]):
     """Test that Lambda layers are deployed for Python requirements"""
     client = get_lambda_client()
     
     try:
-        response = client.list_layers()
-        layers = response.get('Layers', [])
+        paginator = client.get_paginator('list_layers')
+        layers = paginator.paginate().build_full_result().get('Layers', [])
         
         # Look for Python requirements layers
         python_layers = []
@@ -191,27 +217,26 @@ def test_lambda_layers_deployed():
             if 'python-requirements' in layer_name.lower() and 'amplify-dev-' in layer_name:
                 python_layers.append(layer_name)
         
-        print(f"✓ Found {len(python_layers)} Python requirements layers")
+        out.append(f"✓ Found {len(python_layers)} Python requirements layers")
         
         if python_layers:
             for layer_name in python_layers:
-                print(f"  - {layer_name}")
+                out.append(f"  - {layer_name}")
         
         # Property: At least one Python requirements layer should exist
         return len(python_layers) > 0
         
     except Exception as e:
-        print(f"✗ Lambda layers test failed: {str(e)}")
+        out.append(f"✗ Lambda layers test failed: {str(e)}")
         return False
 
-def test_service_specific_resources():
+def test_service_specific_resources(out: List[str]):
     """Test that service-specific resources exist (DynamoDB tables, etc.)"""
-    session = boto3.Session(profile_name='amplify')
-    dynamodb = session.client('dynamodb')
+    dynamodb = _client('dynamodb')
     
     try:
-        response = dynamodb.list_tables()
-        tables = response.get('TableNames', [])
+        paginator = dynamodb.get_paginator('list_tables')
+        tables = paginator.paginate().build_full_result().get('TableNames', [])
         
         # Look for Amplify tables
         amplify_tables = []
@@ -226,16 +251,24 @@ def test_service_specific_resources():
             if 'amplify-dev-' in table:
                 amplify_tables.append(table)
         
-        print(f"✓ Found {len(amplify_tables)} Amplify DynamoDB tables")
+        out.append(f"✓ Found {len(amplify_tables)} Amplify DynamoDB tables")
+        
+        # Match every table against the expected patterns in a single pass
+        matched_patterns = {
+            pattern
+            for table in amplify_tables
+            for pattern in expected_table_patterns
+            if pattern in table
+        }
         
         # Check for expected tables
         found_patterns = 0
         for pattern in expected_table_patterns:
-            if any(pattern in table for table in amplify_tables):
+            if pattern in matched_patterns:
                 found_patterns += 1
-                print(f"✓ Found table matching pattern: {pattern}")
+                out.append(f"✓ Found table matching pattern: {pattern}")
             else:
-                print(f"⚠ No table found matching pattern: {pattern}")
+                out.append(f"⚠ No table found matching pattern: {pattern}")
         
         success_rate = found_patterns / len(expected_table_patterns)
         
@@ -243,9 +276,14 @@ def test_service_specific_resources():
         return success_rate >= 0.75
         
     except Exception as e:
-        print(f"✗ Service resources test failed: {str(e)}")
+        out.append(f"✗ Service resources test failed: {str(e)}")
         return False
 
+def _run_test(test_fn, *args):
+    """Run a deployment phase, returning (passed, output lines) for the ordered report"""
+    out = []
+    return test_fn(*args, out=out), out
+
 def main():
     """Run all property tests for complete Lambda deployment"""
     print("Running Complete Lambda Deployment Property Tests...")
@@ -253,33 +291,29 @@ def main():
     print("**Validates: Requirements 3.1**")
     print("=" * 70)
     
-    tests_passed = 0
-    total_tests = 5
-    
-    # Test 1: CloudFormation stacks exist
-    print("\n1. Testing CloudFormation stacks deployment...")
-    if test_cloudformation_stacks_exist():
-        tests_passed += 1
+    phases = [
+        ("1. Testing CloudFormation stacks deployment...", test_cloudformation_stacks_exist),
+        ("2. Testing Lambda functions deployment...", test_lambda_functions_deployed),
+        ("3. Testing Lambda function configurations...", test_lambda_function_configurations),
+        ("4. Testing Lambda layers deployment...", test_lambda_layers_deployed),
+        ("5. Testing service-specific resources...", test_service_specific_resources)
+    ]
     
-    # Test 2: Lambda functions deployed
-    print("\n2. Testing Lambda functions deployment...")
-    if test_lambda_functions_deployed():
-        tests_passed += 1
+    # Create the clients before the worker threads need them
+    for service in ('lambda', 'cloudformation', 'dynamodb'):
+        _client(service)
     
-    # Test 3: Lambda function configurations
-    print("\n3. Testing Lambda function configurations...")
-    if test_lambda_function_configurations():
-        tests_passed += 1
+    # The tests share no mutable state and are I/O-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        results = list(executor.map(lambda phase: _run_test(phase[1]), phases))
     
-    # Test 4: Lambda layers deployed
-    print("\n4. Testing Lambda layers deployment...")
-    if test_lambda_layers_deployed():
-        tests_passed += 1
+    # Report in test order with a single write and flush for all tests
+    report = [line for (label, _), (_, lines) in zip(phases, results) for line in (f"\n{label}", *lines)]
+    sys.stdout.write('\n'.join(report) + '\n')
+    sys.stdout.flush()
     
-    # Test 5: Service-specific resources
-    print("\n5. Testing service-specific resources...")
-    if test_service_specific_resources():
-        tests_passed += 1
+    tests_passed = sum(1 for passed, _ in results if passed)
+    total_tests = len(phases)
     
     # Summary
     print("\n" + "=" * 70)
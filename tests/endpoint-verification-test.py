@@ -6,14 +6,33 @@ Verifies that specific API Gateway endpoints are accessible and properly configu
 
 import boto3
 import json
-import requests
 import sys
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any
+from urllib.parse import urlsplit
+
+# Pool sized for the parallel endpoint checks and Lambda policy lookups
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+@lru_cache(maxsize=1)
+def _session():
+    """Get the shared boto3 session for the amplify profile (created once per run)"""
+    return boto3.Session(profile_name='amplify')
+
+@lru_cache(maxsize=None)
+def _client(name: str):
+    """Get the shared client for an AWS service (one per service per run)"""
+    return _session().client(name, config=CLIENT_CONFIG)
 
 def get_api_gateway_client():
     """Get API Gateway client with amplify profile"""
-    session = boto3.Session(profile_name='amplify')
-    return session.client('apigateway')
+    return _client('apigateway')
 
 def get_api_gateway_url():
     """Get the API Gateway base URL"""
@@ -33,7 +52,7 @@ def get_api_gateway_url():
         
         if amplify_api:
             api_id = amplify_api['id']
-            region = boto3.Session(profile_name='amplify').region_name or 'us-east-1'
+            region = _session().region_name or 'us-east-1'
             base_url = f"https://{api_id}.execute-api.{region}.amazonaws.com/dev"
             return base_url
         
@@ -43,7 +62,7 @@ def get_api_gateway_url():
         print(f"Error getting API Gateway URL: {str(e)}")
         return None
 
-def test_endpoint_structure(base_url: str):
+def test_endpoint_structure(base_url: str, out: List[str]):
     """Test that endpoints have the expected structure"""
     
     # Expected endpoints from our deployments
@@ -63,54 +82,59 @@ def test_endpoint_structure(base_url: str):
         ]
     }
     
-    print(f"Base URL: {base_url}")
+    out.append(f"Base URL: {base_url}")
     
     all_endpoints_exist = True
     
     for service, endpoints in expected_endpoints.items():
-        print(f"\nTesting {service} endpoints:")
+        out.append(f"\nTesting {service} endpoints:")
         
         for endpoint in endpoints:
             full_url = f"{base_url}{endpoint}"
             
             try:
-                # We're not actually calling the endpoint (would need auth)
-                # Just verify the URL structure is valid
-                print(f"  ✓ Endpoint structure valid: {endpoint}")
+                # We're not actually calling the endpoint (would need auth), so no HTTP
+                # client is needed; just verify the URL structure is valid
+                url_parts = urlsplit(full_url)
+                if url_parts.scheme != 'https' or not url_parts.netloc or not url_parts.path.endswith(endpoint):
+                    raise ValueError(f"malformed URL {full_url}")
+                
+                out.append(f"  ✓ Endpoint structure valid: {endpoint}")
                 
             except Exception as e:
-                print(f"  ✗ Endpoint structure invalid: {endpoint} - {str(e)}")
+                out.append(f"  ✗ Endpoint structure invalid: {endpoint} - {str(e)}")
                 all_endpoints_exist = False
     
     return all_endpoints_exist
 
-def test_api_gateway_cors_configuration(api_id: str):
+def test_api_gateway_cors_configuration(api_id: str, out: List[str]):
     """Test CORS configuration on API Gateway"""
     client = get_api_gateway_client()
     
     try:
-        # Get resources to check for CORS
-        response = client.get_resources(restApiId=api_id)
-        resources = response.get('items', [])
+        # Get resources to check for CORS, page by page so the scan can stop early
+        paginator = client.get_paginator('get_resources')
+        resources = (
+            resource
+            for page in paginator.paginate(restApiId=api_id, PaginationConfig={'PageSize': 500})
+            for resource in page.get('items', [])
+        )
         
-        cors_enabled_resources = 0
+        # One resource with an OPTIONS method (indicates CORS) is enough to pass
+        cors_resource = next((r for r in resources if 'OPTIONS' in r.get('resourceMethods', {})), None)
         
-        for resource in resources:
-            resource_id = resource.get('id')
-            methods = resource.get('resourceMethods', {})
-            
-            # Check if OPTIONS method exists (indicates CORS)
-            if 'OPTIONS' in methods:
-                cors_enabled_resources += 1
+        if cors_resource is None:
+            out.append("✗ No resources with CORS enabled found")
+            return False
         
-        print(f"✓ Found {cors_enabled_resources} resources with CORS enabled")
-        return cors_enabled_resources > 0
+        out.append(f"✓ Found resource with CORS enabled: {cors_resource.get('path')}")
+        return True
         
     except Exception as e:
-        print(f"✗ CORS configuration test failed: {str(e)}")
+        out.append(f"✗ CORS configuration test failed: {str(e)}")
         return False
 
-def test_api_gateway_stages(api_id: str):
+def test_api_gateway_stages(api_id: str, out: List[str]):
     """Test that API Gateway has proper stages configured"""
     client = get_api_gateway_client()
     
@@ -124,77 +148,84 @@ def test_api_gateway_stages(api_id: str):
         for stage in stages:
             if stage.get('stageName') == 'dev':
                 dev_stage_exists = True
-                print(f"✓ Found 'dev' stage with deployment ID: {stage.get('deploymentId')}")
+                out.append(f"✓ Found 'dev' stage with deployment ID: {stage.get('deploymentId')}")
                 break
         
         if not dev_stage_exists:
-            print("✗ 'dev' stage not found")
+            out.append("✗ 'dev' stage not found")
         
         return dev_stage_exists
         
     except Exception as e:
-        print(f"✗ API Gateway stages test failed: {str(e)}")
+        out.append(f"✗ API Gateway stages test failed: {str(e)}")
         return False
 
-def test_lambda_permissions():
+def _safe_get_policy(func_name: str):
+    """Fetch and parse a function's resource policy, returning (policy, error)"""
+    try:
+        policy_response = _client('lambda').get_policy(FunctionName=func_name)
+        return json.loads(policy_response['Policy']), None
+    except Exception as e:
+        return None, e
+
+def test_lambda_permissions(out: List[str]):
     """Test that Lambda functions have proper API Gateway permissions"""
-    session = boto3.Session(profile_name='amplify')
-    lambda_client = session.client('lambda')
+    lambda_client = _client('lambda')
     
     try:
-        # Get Lambda functions
-        response = lambda_client.list_functions()
-        functions = response.get('Functions', [])
-        
         # Check a few key functions for API Gateway permissions
         key_functions = [
             'amplify-dev-lambda-dev-chat_endpoint',
             'amplify-dev-assistants-dev-create_ast'
         ]
         
+        # The policy lookups are independent, so fetch them concurrently over the shared client
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            policies = dict(zip(key_functions, executor.map(_safe_get_policy, key_functions)))
+        
         permissions_ok = True
         
-        for func_name in key_functions:
-            try:
-                # Get function policy
-                policy_response = lambda_client.get_policy(FunctionName=func_name)
-                policy = json.loads(policy_response['Policy'])
-                
-                # Check if there's an API Gateway permission
-                has_api_gateway_permission = False
-                for statement in policy.get('Statement', []):
-                    if 'apigateway' in statement.get('Principal', {}).get('Service', ''):
-                        has_api_gateway_permission = True
-                        break
-                
-                if has_api_gateway_permission:
-                    print(f"✓ {func_name} has API Gateway permissions")
-                else:
-                    print(f"⚠ {func_name} may not have proper API Gateway permissions")
-                    
-            except lambda_client.exceptions.ResourceNotFoundException:
-                print(f"⚠ Function {func_name} not found")
+        for func_name, (policy, error) in policies.items():
+            if isinstance(error, lambda_client.exceptions.ResourceNotFoundException):
+                out.append(f"⚠ Function {func_name} not found")
                 permissions_ok = False
-            except Exception as e:
-                if 'does not exist' in str(e):
-                    print(f"⚠ No policy found for {func_name} (may use resource-based permissions)")
+                continue
+            
+            if error:
+                if 'does not exist' in str(error):
+                    out.append(f"⚠ No policy found for {func_name} (may use resource-based permissions)")
                 else:
-                    print(f"⚠ Error checking permissions for {func_name}: {str(e)}")
+                    out.append(f"⚠ Error checking permissions for {func_name}: {str(error)}")
+                continue
+            
+            # Check if there's an API Gateway permission
+            has_api_gateway_permission = False
+            for statement in policy.get('Statement', []):
+                if 'apigateway' in statement.get('Principal', {}).get('Service', ''):
+                    has_api_gateway_permission = True
+                    break
+            
+            if has_api_gateway_permission:
+                out.append(f"✓ {func_name} has API Gateway permissions")
+            else:
+                out.append(f"⚠ {func_name} may not have proper API Gateway permissions")
         
         return permissions_ok
         
     except Exception as e:
-        print(f"✗ Lambda permissions test failed: {str(e)}")
+        out.append(f"✗ Lambda permissions test failed: {str(e)}")
         return False
 
+def _run_test(test_fn, *args):
+    """Run one endpoint check with buffered output, returning (passed, lines)"""
+    out = []
+    return test_fn(*args, out=out), out
+
 def main():
     """Run all endpoint verification tests"""
     print("Running API Gateway Endpoint Verification Tests...")
     print("=" * 60)
     
-    tests_passed = 0
-    total_tests = 5
-    
     # Get API Gateway URL
     base_url = get_api_gateway_url()
     if not base_url:
@@ -204,25 +235,24 @@ def main():
     # Extract API ID from URL
     api_id = base_url.split('//')[1].split('.')[0]
     
-    # Test 1: Endpoint structure
-    print("\n1. Testing endpoint structure...")
-    if test_endpoint_structure(base_url):
-        tests_passed += 1
+    phases = [
+        ("1. Testing endpoint structure...", test_endpoint_structure, (base_url,)),
+        ("2. Testing CORS configuration...", test_api_gateway_cors_configuration, (api_id,)),
+        ("3. Testing API Gateway stages...", test_api_gateway_stages, (api_id,)),
+        ("4. Testing Lambda permissions...", test_lambda_permissions, ())
+    ]
     
-    # Test 2: CORS configuration
-    print("\n2. Testing CORS configuration...")
-    if test_api_gateway_cors_configuration(api_id):
-        tests_passed += 1
+    # Once the API is known the tests share no mutable state and are I/O-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        results = list(executor.map(lambda phase: _run_test(phase[1], *phase[2]), phases))
     
-    # Test 3: API Gateway stages
-    print("\n3. Testing API Gateway stages...")
-    if test_api_gateway_stages(api_id):
-        tests_passed += 1
+    # Report in test order with a single write and flush for all tests
+    report = [line for (label, _, _), (_, lines) in zip(phases, results) for line in (f"\n{label}", *lines)]
+    sys.stdout.write('\n'.join(report) + '\n')
+    sys.stdout.flush()
     
-    # Test 4: Lambda permissions
-    print("\n4. Testing Lambda permissions...")
-    if test_lambda_permissions():
-        tests_passed += 1
+    tests_passed = sum(1 for passed, _ in results if passed)
+    total_tests = len(phases) + 1  # Plus the overall integration check below
     
     # Test 5: Overall integration
     print("\n5. Testing overall integration...")